@@ -44,6 +44,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('command', args.get('command'))
 	# paths
 	apply_state_item('temp_path', args.get('temp_path'))
+	apply_state_item('face_cache_path', args.get('face_cache_path'))
 	apply_state_item('jobs_path', args.get('jobs_path'))
 	apply_state_item('source_paths', args.get('source_paths'))
 	apply_state_item('target_path', args.get('target_path'))
@@ -57,6 +58,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_detector_size', args.get('face_detector_size'))
 	apply_state_item('face_detector_angles', args.get('face_detector_angles'))
 	apply_state_item('face_detector_score', args.get('face_detector_score'))
+	apply_state_item('face_tracker_interval', args.get('face_tracker_interval'))
 	# face landmarker
 	apply_state_item('face_landmarker_model', args.get('face_landmarker_model'))
 	apply_state_item('face_landmarker_score', args.get('face_landmarker_score'))
@@ -81,6 +83,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('trim_frame_start', args.get('trim_frame_start'))
 	apply_state_item('trim_frame_end', args.get('trim_frame_end'))
 	apply_state_item('temp_frame_format', args.get('temp_frame_format'))
+	apply_state_item('video_pipeline', args.get('video_pipeline'))
+	apply_state_item('content_analyser_mode', args.get('content_analyser_mode'))
+	apply_state_item('content_analyser_stride', args.get('content_analyser_stride'))
+	apply_state_item('content_analyser_batch_size', args.get('content_analyser_batch_size'))
 	apply_state_item('keep_temp', args.get('keep_temp'))
 	# output creation
 	apply_state_item('output_image_quality', args.get('output_image_quality'))
@@ -109,6 +115,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	# processors
 	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
 	apply_state_item('processors', args.get('processors'))
+	apply_state_item('processor_mode', args.get('processor_mode'))
 	for processor_module in get_processors_modules(available_processors):
 		processor_module.apply_args(args, apply_state_item)
 	# uis
@@ -120,12 +127,15 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('execution_providers', args.get('execution_providers'))
 	apply_state_item('execution_thread_count', args.get('execution_thread_count'))
 	apply_state_item('execution_queue_count', args.get('execution_queue_count'))
+	apply_state_item('execution_mode', args.get('execution_mode'))
+	apply_state_item('job_worker_count', args.get('job_worker_count'))
 	# download
 	apply_state_item('download_providers', args.get('download_providers'))
 	apply_state_item('download_scope', args.get('download_scope'))
 	# memory
 	apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
 	apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+	apply_state_item('face_store_memory_limit', args.get('face_store_memory_limit'))
 	# misc
 	apply_state_item('log_level', args.get('log_level'))
 	# jobs
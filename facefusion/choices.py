@@ -2,7 +2,7 @@ import logging
 from typing import List, Sequence
 
 from facefusion.common_helper import create_float_range, create_int_range
-from facefusion.typing import Angle, DownloadProvider, DownloadProviderSet, DownloadScope, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, JobStatus, LogLevel, LogLevelSet, OutputAudioEncoder, OutputVideoEncoder, OutputVideoPreset, Race, Score, TempFrameFormat, UiWorkflow, VideoMemoryStrategy
+from facefusion.typing import Angle, ContentAnalyserMode, DownloadProvider, DownloadProviderSet, DownloadScope, ExecutionMode, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, JobStatus, LogLevel, LogLevelSet, OutputAudioEncoder, OutputVideoEncoder, OutputVideoPreset, ProcessorMode, Race, Score, TempFrameFormat, UiWorkflow, VideoMemoryStrategy, VideoPipeline
 
 face_detector_set : FaceDetectorSet =\
 {
@@ -35,6 +35,9 @@ face_mask_region_set : FaceMaskRegionSet =\
 }
 face_mask_regions : List[FaceMaskRegion] = list(face_mask_region_set.keys())
 temp_frame_formats : List[TempFrameFormat] = [ 'bmp', 'jpg', 'png' ]
+video_pipelines : List[VideoPipeline] = [ 'temp-frames', 'stream' ]
+content_analyser_modes : List[ContentAnalyserMode] = [ 'upfront', 'inline' ]
+processor_modes : List[ProcessorMode] = [ 'sequential', 'fused' ]
 output_audio_encoders : List[OutputAudioEncoder] = [ 'aac', 'libmp3lame', 'libopus', 'libvorbis' ]
 output_video_encoders : List[OutputVideoEncoder] = [ 'libx264', 'libx265', 'libvpx-vp9', 'h264_nvenc', 'hevc_nvenc', 'h264_amf', 'hevc_amf', 'h264_qsv', 'hevc_qsv', 'h264_videotoolbox', 'hevc_videotoolbox' ]
 output_video_presets : List[OutputVideoPreset] = [ 'ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow' ]
@@ -85,10 +88,16 @@ job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'completed', 'failed' ]
 
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
 execution_queue_count_range : Sequence[int] = create_int_range(1, 4, 1)
+execution_modes : List[ExecutionMode] = [ 'thread', 'process' ]
+job_worker_count_range : Sequence[int] = create_int_range(1, 32, 1)
 system_memory_limit_range : Sequence[int] = create_int_range(0, 128, 4)
+face_store_memory_limit_range : Sequence[int] = create_int_range(0, 8192, 256)
+content_analyser_stride_range : Sequence[int] = create_int_range(1, 300, 1)
+content_analyser_batch_size_range : Sequence[int] = create_int_range(1, 32, 1)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
 face_landmarker_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
+face_tracker_interval_range : Sequence[int] = create_int_range(1, 30, 1)
 face_mask_blur_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
 face_mask_padding_range : Sequence[int] = create_int_range(0, 100, 1)
 face_selector_age_range : Sequence[int] = create_int_range(0, 100, 1)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import List, Optional
 
 import cv2
 import numpy
@@ -8,7 +9,7 @@ from facefusion import inference_manager, state_manager, wording
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import DownloadScope, Fps, InferencePool, ModelOptions, ModelSet, VisionFrame
+from facefusion.typing import ContentAnalysis, DownloadScope, Fps, InferencePool, ModelOptions, ModelSet, VisionFrame
 from facefusion.vision import detect_video_fps, get_video_frame, read_image
 
 PROBABILITY_LIMIT = 0.80
@@ -68,28 +69,42 @@ def analyse_stream(vision_frame : VisionFrame, video_fps : Fps) -> bool:
 	global STREAM_COUNTER
 
 	STREAM_COUNTER = STREAM_COUNTER + 1
-	if STREAM_COUNTER % int(video_fps) == 0:
+	if STREAM_COUNTER % calc_frame_step(video_fps) == 0:
 		return analyse_frame(vision_frame)
 	return False
 
 
 def analyse_frame(vision_frame : VisionFrame) -> bool:
-	vision_frame = prepare_frame(vision_frame)
-	probability = forward(vision_frame)
+	return analyse_frames([ vision_frame ])[0]
 
-	return probability > PROBABILITY_LIMIT
 
+def analyse_frames(vision_frames : List[VisionFrame]) -> List[bool]:
+	vision_frames = numpy.concatenate([ prepare_frame(vision_frame) for vision_frame in vision_frames ])
+	probabilities = forward_frames(vision_frames)
 
-def forward(vision_frame : VisionFrame) -> float:
+	return [ probability > PROBABILITY_LIMIT for probability in probabilities.tolist() ]
+
+
+def forward_frames(vision_frames : VisionFrame) -> numpy.ndarray:
+	if inference_manager.has_dynamic_batch(get_inference_pool(), 'content_analyser'):
+		return forward(vision_frames)
+	return numpy.concatenate([ forward(vision_frame[numpy.newaxis]) for vision_frame in vision_frames ])
+
+
+def forward(vision_frame : VisionFrame) -> numpy.ndarray:
 	content_analyser = get_inference_pool().get('content_analyser')
 
 	with conditional_thread_semaphore():
-		probability = content_analyser.run(None,
+		probabilities = content_analyser.run(None,
 		{
 			'input': vision_frame
-		})[0][0][1]
+		})[0][:, 1]
 
-	return probability
+	return probabilities
+
+
+def calc_frame_step(video_fps : Fps) -> int:
+	return max(state_manager.get_item('content_analyser_stride') or int(video_fps), 1)
 
 
 def prepare_frame(vision_frame : VisionFrame) -> VisionFrame:
@@ -110,17 +125,87 @@ def analyse_image(image_path : str) -> bool:
 @lru_cache(maxsize = None)
 def analyse_video(video_path : str, trim_frame_start : int, trim_frame_end : int) -> bool:
 	video_fps = detect_video_fps(video_path)
-	frame_range = range(trim_frame_start, trim_frame_end)
-	rate = 0.0
-	counter = 0
+	content_analysis = create_content_analysis(trim_frame_start, trim_frame_end, video_fps)
 
-	with tqdm(total = len(frame_range), desc = wording.get('analysing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-		for frame_number in frame_range:
-			if frame_number % int(video_fps) == 0:
+	with tqdm(total = trim_frame_end - trim_frame_start, desc = wording.get('analysing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		for frame_number in range(trim_frame_start, trim_frame_end):
+			if is_content_analysed(content_analysis):
+				break
+			if is_content_frame(content_analysis, frame_number):
 				vision_frame = get_video_frame(video_path, frame_number)
-				if analyse_frame(vision_frame):
-					counter += 1
-			rate = counter * int(video_fps) / len(frame_range) * 100
+				analyse_content_frame(content_analysis, frame_number, vision_frame)
+			progress.update()
+			progress.set_postfix(rate = calc_content_rate(content_analysis))
+	return flush_content_analysis(content_analysis)
+
+
+def analyse_temp_frames(temp_frame_paths : List[str], temp_video_fps : Fps) -> bool:
+	content_analysis = create_content_analysis(0, len(temp_frame_paths), temp_video_fps)
+
+	with tqdm(total = len(temp_frame_paths), desc = wording.get('analysing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		for frame_number, temp_frame_path in enumerate(sorted(temp_frame_paths)):
+			if is_content_analysed(content_analysis):
+				break
+			if is_content_frame(content_analysis, frame_number):
+				vision_frame = read_image(temp_frame_path)
+				analyse_content_frame(content_analysis, frame_number, vision_frame)
 			progress.update()
-			progress.set_postfix(rate = rate)
-	return rate > RATE_LIMIT
+			progress.set_postfix(rate = calc_content_rate(content_analysis))
+	return flush_content_analysis(content_analysis)
+
+
+def create_content_analysis(frame_start : int, frame_end : int, video_fps : Fps) -> ContentAnalysis:
+	return\
+	{
+		'frame_start': frame_start,
+		'frame_end': frame_end,
+		'frame_step': calc_frame_step(video_fps),
+		'batch_size': state_manager.get_item('content_analyser_batch_size') or 1,
+		'vision_frames': [],
+		'counter': 0,
+		'rejected': None
+	}
+
+
+def is_content_frame(content_analysis : ContentAnalysis, frame_number : int) -> bool:
+	return frame_number % content_analysis.get('frame_step') == 0
+
+
+def analyse_content_frame(content_analysis : ContentAnalysis, frame_number : int, vision_frame : VisionFrame) -> bool:
+	if not is_content_analysed(content_analysis) and is_content_frame(content_analysis, frame_number):
+		content_analysis['vision_frames'].append(vision_frame)
+		frame_remaining = (content_analysis.get('frame_end') - 1) // content_analysis.get('frame_step') - frame_number // content_analysis.get('frame_step')
+
+		if len(content_analysis.get('vision_frames')) >= content_analysis.get('batch_size') or frame_remaining <= 0:
+			flush_content_analysis(content_analysis, frame_remaining)
+	return is_content_rejected(content_analysis)
+
+
+def flush_content_analysis(content_analysis : ContentAnalysis, frame_remaining : int = 0) -> bool:
+	vision_frames = content_analysis.get('vision_frames')
+
+	if vision_frames and not is_content_analysed(content_analysis):
+		content_analysis['counter'] += sum(analyse_frames(vision_frames))
+		content_analysis['vision_frames'] = []
+
+		if calc_content_rate(content_analysis) > RATE_LIMIT:
+			content_analysis['rejected'] = True
+		elif calc_content_rate(content_analysis, max(frame_remaining, 0)) <= RATE_LIMIT:
+			content_analysis['rejected'] = False
+	return is_content_rejected(content_analysis)
+
+
+def calc_content_rate(content_analysis : ContentAnalysis, frame_remaining : int = 0) -> float:
+	frame_total = content_analysis.get('frame_end') - content_analysis.get('frame_start')
+
+	if frame_total > 0:
+		return (content_analysis.get('counter') + frame_remaining) * content_analysis.get('frame_step') / frame_total * 100
+	return 0.0
+
+
+def is_content_analysed(content_analysis : Optional[ContentAnalysis]) -> bool:
+	return bool(content_analysis) and content_analysis.get('rejected') is not None
+
+
+def is_content_rejected(content_analysis : Optional[ContentAnalysis]) -> bool:
+	return bool(content_analysis) and content_analysis.get('rejected') is True
@@ -9,24 +9,28 @@ import numpy
 from facefusion import content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, logger, process_manager, state_manager, voice_extractor, wording
 from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
 from facefusion.common_helper import get_first
-from facefusion.content_analyser import analyse_image, analyse_video
+from facefusion.content_analyser import analyse_image, analyse_temp_frames, analyse_video, create_content_analysis, is_content_rejected
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import conditional_exit, graceful_exit, hard_exit
 from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face
+from facefusion.face_cache import load_face_cache, save_face_cache
 from facefusion.face_selector import sort_and_filter_faces
 from facefusion.face_store import append_reference_face, clear_reference_faces, get_reference_faces
+from facefusion.face_tracker import clear_face_tracker
 from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
 from facefusion.filesystem import filter_audio_paths, is_image, is_video, list_directory, resolve_file_pattern
+from facefusion.frame_checkpoint import create_frame_checkpoint, has_analysed_content, resume_frame_checkpoint, set_analysed_content, set_frame_total
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
-from facefusion.processors.core import get_processors_modules
+from facefusion.processors.core import collect_face_attributes, get_processors_modules, multi_process_frames, multi_process_stream, process_fused_frames
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
+from facefusion.scene_detector import clear_scene_detector
 from facefusion.statistics import conditional_log_statistics
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_frame_paths, move_temp_file
 from facefusion.typing import Args, ErrorCode
-from facefusion.vision import get_video_frame, pack_resolution, read_image, read_static_images, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
+from facefusion.vision import count_trim_frame_total, get_video_frame, pack_resolution, read_image, read_static_images, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
 
 
 def cli() -> None:
@@ -230,7 +234,7 @@ def route_job_runner() -> ErrorCode:
 		return 1
 	if state_manager.get_item('command') == 'job-run-all':
 		logger.info(wording.get('running_jobs'), __name__)
-		if job_runner.run_jobs(process_step):
+		if job_runner.run_jobs(process_step, state_manager.get_item('job_worker_count')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
@@ -244,7 +248,7 @@ def route_job_runner() -> ErrorCode:
 		return 1
 	if state_manager.get_item('command') == 'job-retry-all':
 		logger.info(wording.get('retrying_jobs'), __name__)
-		if job_runner.retry_jobs(process_step):
+		if job_runner.retry_jobs(process_step, state_manager.get_item('job_worker_count')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
@@ -308,12 +312,17 @@ def conditional_process() -> ErrorCode:
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		if not processor_module.pre_process('output'):
 			return 2
-	conditional_append_reference_faces()
-	if is_image(state_manager.get_item('target_path')):
-		return process_image(start_time)
-	if is_video(state_manager.get_item('target_path')):
-		return process_video(start_time)
-	return 0
+	state_manager.set_item('face_attributes', collect_face_attributes(state_manager.get_item('processors')))
+
+	try:
+		conditional_append_reference_faces()
+		if is_image(state_manager.get_item('target_path')):
+			return process_image(start_time)
+		if is_video(state_manager.get_item('target_path')):
+			return process_video(start_time)
+		return 0
+	finally:
+		state_manager.clear_item('face_attributes')
 
 
 def conditional_append_reference_faces() -> None:
@@ -390,52 +399,96 @@ def process_image(start_time : float) -> ErrorCode:
 
 def process_video(start_time : float) -> ErrorCode:
 	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
-	if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
+	if state_manager.get_item('content_analyser_mode') == 'upfront' and analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
 		return 3
-	# clear temp
-	logger.debug(wording.get('clearing_temp'), __name__)
-	clear_temp_directory(state_manager.get_item('target_path'))
-	# create temp
-	logger.debug(wording.get('creating_temp'), __name__)
-	create_temp_directory(state_manager.get_item('target_path'))
-	# extract frames
+	is_resumable = state_manager.get_item('video_pipeline') == 'temp-frames' and resume_frame_checkpoint(state_manager.get_item('target_path'))
+	if not is_resumable:
+		# clear temp
+		logger.debug(wording.get('clearing_temp'), __name__)
+		clear_temp_directory(state_manager.get_item('target_path'))
+		# create temp
+		logger.debug(wording.get('creating_temp'), __name__)
+		create_temp_directory(state_manager.get_item('target_path'))
 	process_manager.start()
 	temp_video_resolution = pack_resolution(restrict_video_resolution(state_manager.get_item('target_path'), unpack_resolution(state_manager.get_item('output_video_resolution'))))
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-	logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
-	if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('extracting_frames_succeed'), __name__)
-	else:
-		if is_process_stopping():
+	load_face_cache(state_manager.get_item('target_path'))
+	clear_face_tracker()
+	clear_scene_detector()
+	if state_manager.get_item('video_pipeline') == 'stream':
+		# stream frames
+		logger.info(wording.get('streaming_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+		content_analysis = None
+		if state_manager.get_item('content_analyser_mode') == 'inline':
+			content_analysis = create_content_analysis(0, count_trim_frame_total(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end), temp_video_fps)
+		if multi_process_stream(state_manager.get_item('source_paths'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end, content_analysis):
+			logger.debug(wording.get('streaming_frames_succeed'), __name__)
+			save_face_cache(state_manager.get_item('target_path'))
+		else:
+			if is_content_rejected(content_analysis):
+				clear_temp_directory(state_manager.get_item('target_path'))
+				process_manager.end()
+				return 3
+			if is_process_stopping():
+				process_manager.end()
+				return 4
+			logger.error(wording.get('streaming_frames_failed'), __name__)
 			process_manager.end()
-			return 4
-		logger.error(wording.get('extracting_frames_failed'), __name__)
-		process_manager.end()
-		return 1
-	# process frames
-	temp_frame_paths = get_temp_frame_paths(state_manager.get_item('target_path'))
-	if temp_frame_paths:
+			return 1
 		for processor_module in get_processors_modules(state_manager.get_item('processors')):
-			logger.info(wording.get('processing'), processor_module.__name__)
-			processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
 			processor_module.post_process()
-		if is_process_stopping():
-			return 4
 	else:
-		logger.error(wording.get('temp_frames_not_found'), __name__)
-		process_manager.end()
-		return 1
-	# merge video
-	logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
-	if merge_video(state_manager.get_item('target_path'), state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps')):
-		logger.debug(wording.get('merging_video_succeed'), __name__)
-	else:
-		if is_process_stopping():
+		if not is_resumable:
+			# extract frames
+			logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+			create_frame_checkpoint(state_manager.get_item('target_path'))
+			if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+				logger.debug(wording.get('extracting_frames_succeed'), __name__)
+				set_frame_total(state_manager.get_item('target_path'), len(get_temp_frame_paths(state_manager.get_item('target_path'))))
+			else:
+				if is_process_stopping():
+					process_manager.end()
+					return 4
+				logger.error(wording.get('extracting_frames_failed'), __name__)
+				process_manager.end()
+				return 1
+		# process frames
+		temp_frame_paths = get_temp_frame_paths(state_manager.get_item('target_path'))
+		if state_manager.get_item('content_analyser_mode') == 'inline' and not has_analysed_content(state_manager.get_item('target_path')):
+			if analyse_temp_frames(temp_frame_paths, temp_video_fps):
+				clear_temp_directory(state_manager.get_item('target_path'))
+				process_manager.end()
+				return 3
+			set_analysed_content(state_manager.get_item('target_path'))
+		if temp_frame_paths:
+			if state_manager.get_item('processor_mode') == 'fused':
+				logger.info(wording.get('processing'), __name__)
+				multi_process_frames(state_manager.get_item('source_paths'), temp_frame_paths, process_fused_frames)
+				save_face_cache(state_manager.get_item('target_path'))
+				for processor_module in get_processors_modules(state_manager.get_item('processors')):
+					processor_module.post_process()
+			else:
+				for processor_module in get_processors_modules(state_manager.get_item('processors')):
+					logger.info(wording.get('processing'), processor_module.__name__)
+					processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
+					processor_module.post_process()
+			if is_process_stopping():
+				return 4
+		else:
+			logger.error(wording.get('temp_frames_not_found'), __name__)
 			process_manager.end()
-			return 4
-		logger.error(wording.get('merging_video_failed'), __name__)
-		process_manager.end()
-		return 1
+			return 1
+		# merge video
+		logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
+		if merge_video(state_manager.get_item('target_path'), state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps')):
+			logger.debug(wording.get('merging_video_succeed'), __name__)
+		else:
+			if is_process_stopping():
+				process_manager.end()
+				return 4
+			logger.error(wording.get('merging_video_failed'), __name__)
+			process_manager.end()
+			return 1
 	# handle audio
 	if state_manager.get_item('skip_audio'):
 		logger.info(wording.get('skipping_audio'), __name__)
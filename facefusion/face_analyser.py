@@ -4,56 +4,65 @@ import numpy
 
 from facefusion import state_manager
 from facefusion.common_helper import get_first
-from facefusion.face_classifier import classify_face
-from facefusion.face_detector import detect_faces, detect_rotated_faces
+from facefusion.face_classifier import classify_faces
+from facefusion.face_detector import detect_angled_faces
 from facefusion.face_helper import apply_nms, convert_to_face_landmark_5, estimate_face_angle, get_nms_threshold
-from facefusion.face_landmarker import detect_face_landmarks, estimate_face_landmark_68_5
-from facefusion.face_recognizer import calc_embedding
+from facefusion.face_landmarker import detect_batch_face_landmarks, estimate_face_landmarks_68_5
+from facefusion.face_recognizer import calc_embeddings
 from facefusion.face_store import get_static_faces, set_static_faces
-from facefusion.typing import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
+from facefusion.typing import BoundingBoxes, Face, FaceAttribute, FaceLandmarkSet, FaceLandmarks5, FaceScoreSet, FaceScores, VisionFrame
 
 
-def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_scores : List[Score], face_landmarks_5 : List[FaceLandmark5]) -> List[Face]:
+def create_faces(vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_scores : FaceScores, face_landmarks_5 : FaceLandmarks5) -> List[Face]:
 	faces = []
 	nms_threshold = get_nms_threshold(state_manager.get_item('face_detector_model'), state_manager.get_item('face_detector_angles'))
 	keep_indices = apply_nms(bounding_boxes, face_scores, state_manager.get_item('face_detector_score'), nms_threshold)
 
-	for index in keep_indices:
-		bounding_box = bounding_boxes[index]
-		face_score = face_scores[index]
-		face_landmark_5 = face_landmarks_5[index]
-		face_landmark_5_68 = face_landmark_5
-		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmark_5_68)
-		face_landmark_68 = face_landmark_68_5
-		face_landmark_score_68 = 0.0
-		face_angle = estimate_face_angle(face_landmark_68_5)
-
-		if state_manager.get_item('face_landmarker_score') > 0:
-			face_landmark_68, face_landmark_score_68 = detect_face_landmarks(vision_frame, bounding_box, face_angle)
-		if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
-			face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
-
+	if len(keep_indices) == 0:
+		return faces
+
+	keep_indices = numpy.asarray(keep_indices).ravel()
+	bounding_boxes = bounding_boxes[keep_indices]
+	face_scores = face_scores[keep_indices]
+	face_landmarks_5 = face_landmarks_5[keep_indices]
+	face_landmarks_68_5 = estimate_face_landmarks_68_5(face_landmarks_5)
+	face_landmarks_68 = face_landmarks_68_5
+	face_landmark_scores_68 = [ 0.0 ] * len(keep_indices)
+	face_angles = [ estimate_face_angle(face_landmark_68_5) for face_landmark_68_5 in face_landmarks_68_5 ]
+
+	if state_manager.get_item('face_landmarker_score') > 0:
+		face_landmarks_68, face_landmark_scores_68 = detect_batch_face_landmarks(vision_frame, list(bounding_boxes), face_angles)
+	face_landmarks_5_68 = [ convert_to_face_landmark_5(face_landmark_68) if face_landmark_score_68 > state_manager.get_item('face_landmarker_score') else face_landmark_5 for face_landmark_5, face_landmark_68, face_landmark_score_68 in zip(face_landmarks_5, face_landmarks_68, face_landmark_scores_68) ]
+	face_attributes = get_face_attributes()
+	embeddings = normed_embeddings = [ None ] * len(keep_indices)
+	face_classifications = [ (None, None, None) ] * len(keep_indices)
+
+	if 'embedding' in face_attributes:
+		embeddings, normed_embeddings = calc_embeddings(vision_frame, face_landmarks_5_68)
+	if 'classification' in face_attributes:
+		face_classifications = classify_faces(vision_frame, face_landmarks_5_68)
+
+	for index in range(len(keep_indices)):
 		face_landmark_set : FaceLandmarkSet =\
 		{
-			'5': face_landmark_5,
-			'5/68': face_landmark_5_68,
-			'68': face_landmark_68,
-			'68/5': face_landmark_68_5
+			'5': face_landmarks_5[index],
+			'5/68': face_landmarks_5_68[index],
+			'68': face_landmarks_68[index],
+			'68/5': face_landmarks_68_5[index]
 		}
 		face_score_set : FaceScoreSet =\
 		{
-			'detector': face_score,
-			'landmarker': face_landmark_score_68
+			'detector': float(face_scores[index]),
+			'landmarker': face_landmark_scores_68[index]
 		}
-		embedding, normed_embedding = calc_embedding(vision_frame, face_landmark_set.get('5/68'))
-		gender, age, race = classify_face(vision_frame, face_landmark_set.get('5/68'))
+		gender, age, race = face_classifications[index]
 		faces.append(Face(
-			bounding_box = bounding_box,
+			bounding_box = bounding_boxes[index],
 			score_set = face_score_set,
 			landmark_set = face_landmark_set,
-			angle = face_angle,
-			embedding = embedding,
-			normed_embedding = normed_embedding,
+			angle = face_angles[index],
+			embedding = embeddings[index],
+			normed_embedding = normed_embeddings[index],
 			gender = gender,
 			age = age,
 			race = race
@@ -61,6 +70,23 @@ def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox],
 	return faces
 
 
+def get_face_attributes() -> List[FaceAttribute]:
+	face_attributes = state_manager.get_item('face_attributes')
+
+	if face_attributes is None:
+		return [ 'embedding', 'classification' ]
+	return face_attributes
+
+
+def has_face_attributes(faces : List[Face], face_attributes : List[FaceAttribute]) -> bool:
+	for face in faces:
+		if 'embedding' in face_attributes and face.embedding is None:
+			return False
+		if 'classification' in face_attributes and face.gender is None:
+			return False
+	return True
+
+
 def get_one_face(faces : List[Face], position : int = 0) -> Optional[Face]:
 	if faces:
 		position = min(position, len(faces) - 1)
@@ -76,16 +102,17 @@ def get_average_face(faces : List[Face]) -> Optional[Face]:
 		first_face = get_first(faces)
 
 		for face in faces:
-			embeddings.append(face.embedding)
-			normed_embeddings.append(face.normed_embedding)
+			if face.embedding is not None:
+				embeddings.append(face.embedding)
+				normed_embeddings.append(face.normed_embedding)
 
 		return Face(
 			bounding_box = first_face.bounding_box,
 			score_set = first_face.score_set,
 			landmark_set = first_face.landmark_set,
 			angle = first_face.angle,
-			embedding = numpy.mean(embeddings, axis = 0),
-			normed_embedding = numpy.mean(normed_embeddings, axis = 0),
+			embedding = numpy.mean(embeddings, axis = 0) if embeddings else None,
+			normed_embedding = numpy.mean(normed_embeddings, axis = 0) if normed_embeddings else None,
 			gender = first_face.gender,
 			age = first_face.age,
 			race = first_face.race
@@ -95,30 +122,26 @@ def get_average_face(faces : List[Face]) -> Optional[Face]:
 
 def get_many_faces(vision_frames : List[VisionFrame]) -> List[Face]:
 	many_faces : List[Face] = []
-
-	for vision_frame in vision_frames:
-		if numpy.any(vision_frame):
-			static_faces = get_static_faces(vision_frame)
-			if static_faces:
-				many_faces.extend(static_faces)
-			else:
-				all_bounding_boxes = []
-				all_face_scores = []
-				all_face_landmarks_5 = []
-
-				for face_detector_angle in state_manager.get_item('face_detector_angles'):
-					if face_detector_angle == 0:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
-					else:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_rotated_faces(vision_frame, face_detector_angle)
-					all_bounding_boxes.extend(bounding_boxes)
-					all_face_scores.extend(face_scores)
-					all_face_landmarks_5.extend(face_landmarks_5)
-
-				if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
-					faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
-
-					if faces:
-						many_faces.extend(faces)
-						set_static_faces(vision_frame, faces)
+	face_attributes = get_face_attributes()
+	has_vision_frames = [ numpy.any(vision_frame) for vision_frame in vision_frames ]
+	many_static_faces = [ get_static_faces(vision_frame) if has_vision_frame else None for vision_frame, has_vision_frame in zip(vision_frames, has_vision_frames) ]
+	many_static_faces = [ static_faces if static_faces and has_face_attributes(static_faces, face_attributes) else None for static_faces in many_static_faces ]
+	detect_indices = [ index for index, has_vision_frame in enumerate(has_vision_frames) if has_vision_frame and not many_static_faces[index] ]
+	detections = {}
+
+	if detect_indices:
+		detections = dict(zip(detect_indices, detect_angled_faces([ vision_frames[index] for index in detect_indices ], state_manager.get_item('face_detector_angles'))))
+
+	for index, vision_frame in enumerate(vision_frames):
+		if many_static_faces[index]:
+			many_faces.extend(many_static_faces[index])
+		if index in detections:
+			all_bounding_boxes, all_face_scores, all_face_landmarks_5 = detections.get(index)
+
+			if all_face_scores.size and state_manager.get_item('face_detector_score') > 0:
+				faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
+
+				if faces:
+					many_faces.extend(faces)
+					set_static_faces(vision_frame, faces)
 	return many_faces
@@ -0,0 +1,178 @@
+import hashlib
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_analyser import get_face_attributes
+from facefusion.filesystem import create_directory, is_file, move_file
+from facefusion.typing import Face, FaceCache, FaceLandmarkSet, FaceScoreSet
+from facefusion.vision import detect_video_fps, restrict_video_fps
+
+FACE_CACHE : FaceCache =\
+{
+	'faces': {},
+	'modified': False
+}
+
+
+def get_face_cache_path(target_path : str) -> Optional[str]:
+	face_cache_path = state_manager.get_item('face_cache_path')
+
+	if face_cache_path and has_face_cache_support() and is_file(target_path):
+		file_hash = create_file_hash(target_path, os.path.getsize(target_path), os.path.getmtime(target_path))
+		settings_hash = create_settings_hash(target_path)
+		return os.path.join(face_cache_path, file_hash + '-' + settings_hash + '.npz')
+	return None
+
+
+def has_face_cache_support() -> bool:
+	return state_manager.get_item('video_pipeline') == 'stream' or state_manager.get_item('processor_mode') == 'fused'
+
+
+@lru_cache(maxsize = None)
+def create_file_hash(file_path : str, file_size : int, file_mtime : float) -> str:
+	file_hash = hashlib.blake2b(digest_size = 16)
+
+	with open(file_path, 'rb') as file:
+		while chunk := file.read(1024 * 1024):
+			file_hash.update(chunk)
+	return file_hash.hexdigest()
+
+
+def create_settings_hash(target_path : str) -> str:
+	settings =\
+	[
+		state_manager.get_item('face_detector_model'),
+		state_manager.get_item('face_detector_size'),
+		state_manager.get_item('face_detector_angles'),
+		state_manager.get_item('face_detector_score'),
+		state_manager.get_item('face_tracker_interval'),
+		state_manager.get_item('face_landmarker_model'),
+		state_manager.get_item('face_landmarker_score'),
+		state_manager.get_item('output_video_resolution'),
+		state_manager.get_item('output_video_fps'),
+		sorted(set(get_face_attributes()))
+	]
+
+	if restrict_video_fps(target_path, state_manager.get_item('output_video_fps')) != detect_video_fps(target_path):
+		settings.append((state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end')))
+	return hashlib.blake2b(repr(settings).encode(), digest_size = 8).hexdigest()
+
+
+def get_cached_faces(frame_number : int) -> Optional[List[Face]]:
+	return FACE_CACHE.get('faces').get(resolve_frame_number(frame_number))
+
+
+def set_cached_faces(frame_number : int, faces : List[Face]) -> None:
+	frame_number = resolve_frame_number(frame_number)
+
+	if frame_number not in FACE_CACHE.get('faces'):
+		FACE_CACHE['faces'][frame_number] = faces
+		FACE_CACHE['modified'] = True
+
+
+def get_cached_frame_faces() -> Dict[int, List[Face]]:
+	return FACE_CACHE.get('faces')
+
+
+def set_cached_frame_faces(frame_faces : Dict[int, List[Face]]) -> None:
+	FACE_CACHE['faces'] = dict(frame_faces)
+	FACE_CACHE['modified'] = False
+
+
+def resolve_frame_number(frame_number : int) -> int:
+	return (state_manager.get_item('trim_frame_start') or 0) + frame_number
+
+
+def load_face_cache(target_path : str) -> bool:
+	clear_face_cache()
+	face_cache_path = get_face_cache_path(target_path)
+
+	if face_cache_path and is_file(face_cache_path):
+		with numpy.load(face_cache_path) as face_cache:
+			FACE_CACHE['faces'] = unpack_faces(dict(face_cache))
+		return True
+	return False
+
+
+def save_face_cache(target_path : str) -> bool:
+	face_cache_path = get_face_cache_path(target_path)
+
+	if face_cache_path and FACE_CACHE.get('modified') and create_directory(os.path.dirname(face_cache_path)):
+		temp_face_cache_path = face_cache_path + '.tmp'
+
+		with open(temp_face_cache_path, 'wb') as temp_face_cache_file:
+			numpy.savez_compressed(temp_face_cache_file, **pack_faces(FACE_CACHE.get('faces')))
+		FACE_CACHE['modified'] = False
+		return move_file(temp_face_cache_path, face_cache_path)
+	return False
+
+
+def clear_face_cache() -> None:
+	FACE_CACHE['faces'] = {}
+	FACE_CACHE['modified'] = False
+
+
+def pack_faces(frame_faces : Dict[int, List[Face]]) -> Dict[str, numpy.ndarray]:
+	frame_numbers = sorted(frame_faces.keys())
+	faces = [ face for frame_number in frame_numbers for face in frame_faces.get(frame_number) ]
+
+	return\
+	{
+		'frame_numbers': numpy.array(frame_numbers, dtype = numpy.int64),
+		'face_totals': numpy.array([ len(frame_faces.get(frame_number)) for frame_number in frame_numbers ], dtype = numpy.int64),
+		'bounding_boxes': numpy.array([ face.bounding_box for face in faces ], dtype = numpy.float32).reshape(-1, 4),
+		'detector_scores': numpy.array([ face.score_set.get('detector') for face in faces ], dtype = numpy.float32),
+		'landmarker_scores': numpy.array([ face.score_set.get('landmarker') for face in faces ], dtype = numpy.float32),
+		'landmarks_5': numpy.array([ face.landmark_set.get('5') for face in faces ], dtype = numpy.float32).reshape(-1, 5, 2),
+		'landmarks_5_68': numpy.array([ face.landmark_set.get('5/68') for face in faces ], dtype = numpy.float32).reshape(-1, 5, 2),
+		'landmarks_68': numpy.array([ face.landmark_set.get('68') for face in faces ], dtype = numpy.float32).reshape(-1, 68, 2),
+		'landmarks_68_5': numpy.array([ face.landmark_set.get('68/5') for face in faces ], dtype = numpy.float32).reshape(-1, 68, 2),
+		'angles': numpy.array([ face.angle for face in faces ], dtype = numpy.int64),
+		'embeddings': numpy.array([ numpy.full(512, numpy.nan) if face.embedding is None else face.embedding for face in faces ], dtype = numpy.float32).reshape(-1, 512),
+		'normed_embeddings': numpy.array([ numpy.full(512, numpy.nan) if face.normed_embedding is None else face.normed_embedding for face in faces ], dtype = numpy.float32).reshape(-1, 512),
+		'genders': numpy.array([ face.gender or '' for face in faces ], dtype = numpy.str_),
+		'ages': numpy.array([ (-1, -1) if face.age is None else (face.age.start, face.age.stop) for face in faces ], dtype = numpy.int64).reshape(-1, 2),
+		'races': numpy.array([ face.race or '' for face in faces ], dtype = numpy.str_)
+	}
+
+
+def unpack_faces(face_cache : Dict[str, numpy.ndarray]) -> Dict[int, List[Face]]:
+	frame_faces : Dict[int, List[Face]] = {}
+	index = 0
+
+	for frame_number, face_total in zip(face_cache.get('frame_numbers').tolist(), face_cache.get('face_totals').tolist()):
+		frame_faces[frame_number] = []
+
+		for _ in range(face_total):
+			face_landmark_set : FaceLandmarkSet =\
+			{
+				'5': face_cache.get('landmarks_5')[index],
+				'5/68': face_cache.get('landmarks_5_68')[index],
+				'68': face_cache.get('landmarks_68')[index],
+				'68/5': face_cache.get('landmarks_68_5')[index]
+			}
+			face_score_set : FaceScoreSet =\
+			{
+				'detector': float(face_cache.get('detector_scores')[index]),
+				'landmarker': float(face_cache.get('landmarker_scores')[index])
+			}
+			age_start, age_stop = face_cache.get('ages')[index].tolist()
+			has_embedding = not numpy.isnan(face_cache.get('embeddings')[index][0])
+			has_classification = bool(face_cache.get('genders')[index])
+			frame_faces[frame_number].append(Face(
+				bounding_box = face_cache.get('bounding_boxes')[index],
+				score_set = face_score_set,
+				landmark_set = face_landmark_set,
+				angle = int(face_cache.get('angles')[index]),
+				embedding = face_cache.get('embeddings')[index] if has_embedding else None,
+				normed_embedding = face_cache.get('normed_embeddings')[index] if has_embedding else None,
+				gender = str(face_cache.get('genders')[index]) if has_classification else None,
+				age = range(age_start, age_stop) if has_classification else None,
+				race = str(face_cache.get('races')[index]) if has_classification else None
+			))
+			index += 1
+	return frame_faces
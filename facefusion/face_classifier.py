@@ -61,22 +61,39 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hashes) and conditional_download_sources(model_sources)
 
 
-def classify_face(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Gender, Age, Race]:
+def classify_faces(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> List[Tuple[Gender, Age, Race]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
-	crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255
-	crop_vision_frame -= model_mean
-	crop_vision_frame /= model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	gender_id, age_id, race_id = forward(crop_vision_frame)
-	gender = categorize_gender(gender_id[0])
-	age = categorize_age(age_id[0])
-	race = categorize_race(race_id[0])
-	return gender, age, race
+	crop_vision_frames = []
+
+	for face_landmark_5 in face_landmarks_5:
+		crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+		crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255
+		crop_vision_frame -= model_mean
+		crop_vision_frame /= model_standard_deviation
+		crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
+		crop_vision_frames.append(crop_vision_frame)
+
+	gender_ids, age_ids, race_ids = forward_batch(numpy.stack(crop_vision_frames))
+	return [ (categorize_gender(gender_id), categorize_age(age_id), categorize_race(race_id)) for gender_id, age_id, race_id in zip(gender_ids, age_ids, race_ids) ]
+
+
+def forward_batch(crop_vision_frames : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
+	if inference_manager.has_dynamic_batch(get_inference_pool(), 'face_classifier'):
+		return forward(crop_vision_frames)
+
+	gender_ids = []
+	age_ids = []
+	race_ids = []
+
+	for crop_vision_frame in crop_vision_frames:
+		gender_id, age_id, race_id = forward(numpy.expand_dims(crop_vision_frame, axis = 0))
+		gender_ids.extend(gender_id)
+		age_ids.extend(age_id)
+		race_ids.extend(race_id)
+	return gender_ids, age_ids, race_ids
 
 
 def forward(crop_vision_frame : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
@@ -6,10 +6,10 @@ from charset_normalizer.md import lru_cache
 
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_helper import create_rotated_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
+from facefusion.face_helper import create_rotated_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_boxes, transform_bounding_boxes, transform_points
 from facefusion.filesystem import resolve_relative_path
 from facefusion.thread_helper import thread_semaphore
-from facefusion.typing import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, ModelSet, Score, VisionFrame
+from facefusion.typing import Angle, Detection, DownloadScope, DownloadSet, FaceDetection, InferencePool, ModelSet, VisionFrame
 from facefusion.vision import resize_frame_resolution, unpack_resolution
 
 
@@ -112,197 +112,207 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hashes) and conditional_download_sources(model_sources)
 
 
-def detect_faces(vision_frame : VisionFrame) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	all_bounding_boxes : List[BoundingBox] = []
-	all_face_scores : List[Score] = []
-	all_face_landmarks_5 : List[FaceLandmark5] = []
+def detect_batch_faces(vision_frames : List[VisionFrame]) -> List[FaceDetection]:
+	batch_detections : List[List[FaceDetection]] = [ [] for _ in vision_frames ]
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'retinaface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_retinaface(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		for batch_detection, face_detection in zip(batch_detections, detect_with_retinaface(vision_frames, state_manager.get_item('face_detector_size'))):
+			batch_detection.append(face_detection)
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'scrfd' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_scrfd(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		for batch_detection, face_detection in zip(batch_detections, detect_with_scrfd(vision_frames, state_manager.get_item('face_detector_size'))):
+			batch_detection.append(face_detection)
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'yoloface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yoloface(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
-
-	all_bounding_boxes = [ normalize_bounding_box(all_bounding_box) for all_bounding_box in all_bounding_boxes ]
-	return all_bounding_boxes, all_face_scores, all_face_landmarks_5
-
-
-def detect_rotated_faces(vision_frame : VisionFrame, angle : Angle) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	rotated_matrix, rotated_size = create_rotated_matrix_and_size(angle, vision_frame.shape[:2][::-1])
-	rotated_vision_frame = cv2.warpAffine(vision_frame, rotated_matrix, rotated_size)
-	rotated_inverse_matrix = cv2.invertAffineTransform(rotated_matrix)
-	bounding_boxes, face_scores, face_landmarks_5 = detect_faces(rotated_vision_frame)
-	bounding_boxes = [ transform_bounding_box(bounding_box, rotated_inverse_matrix) for bounding_box in bounding_boxes ]
-	face_landmarks_5 = [ transform_points(face_landmark_5, rotated_inverse_matrix) for face_landmark_5 in face_landmarks_5 ]
+		for batch_detection, face_detection in zip(batch_detections, detect_with_yoloface(vision_frames, state_manager.get_item('face_detector_size'))):
+			batch_detection.append(face_detection)
+
+	face_detections = []
+
+	for batch_detection in batch_detections:
+		bounding_boxes, face_scores, face_landmarks_5 = merge_face_detections(batch_detection)
+		face_detections.append((normalize_bounding_boxes(bounding_boxes), face_scores, face_landmarks_5))
+	return face_detections
+
+
+def detect_angled_faces(vision_frames : List[VisionFrame], face_detector_angles : List[Angle]) -> List[FaceDetection]:
+	rotated_vision_frames = []
+	rotated_inverse_matrices = []
+	angled_detections = []
+
+	for vision_frame in vision_frames:
+		for face_detector_angle in face_detector_angles:
+			if face_detector_angle == 0:
+				rotated_vision_frames.append(vision_frame)
+				rotated_inverse_matrices.append(None)
+			else:
+				rotated_matrix, rotated_size = create_rotated_matrix_and_size(face_detector_angle, vision_frame.shape[:2][::-1])
+				rotated_vision_frames.append(cv2.warpAffine(vision_frame, rotated_matrix, rotated_size))
+				rotated_inverse_matrices.append(cv2.invertAffineTransform(rotated_matrix))
+
+	rotated_detections = detect_batch_faces(rotated_vision_frames)
+
+	for index in range(0, len(rotated_detections), len(face_detector_angles)):
+		face_detections = []
+
+		for (bounding_boxes, face_scores, face_landmarks_5), rotated_inverse_matrix in zip(rotated_detections[index:index + len(face_detector_angles)], rotated_inverse_matrices[index:index + len(face_detector_angles)]):
+			if face_scores.size and rotated_inverse_matrix is not None:
+				bounding_boxes = transform_bounding_boxes(bounding_boxes, rotated_inverse_matrix)
+				face_landmarks_5 = transform_points(face_landmarks_5, rotated_inverse_matrix).reshape(-1, 5, 2)
+			face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
+
+		angled_detections.append(merge_face_detections(face_detections))
+	return angled_detections
+
+
+def merge_face_detections(face_detections : List[FaceDetection]) -> FaceDetection:
+	bounding_boxes = numpy.concatenate([ numpy.empty((0, 4)) ] + [ face_detection[0] for face_detection in face_detections ])
+	face_scores = numpy.concatenate([ numpy.empty(0) ] + [ face_detection[1] for face_detection in face_detections ])
+	face_landmarks_5 = numpy.concatenate([ numpy.empty((0, 5, 2)) ] + [ face_detection[2] for face_detection in face_detections ])
 	return bounding_boxes, face_scores, face_landmarks_5
 
 
-def detect_with_retinaface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+def detect_with_retinaface(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
+	batch_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_retinaface(detect_vision_frame)
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detections = forward_with_retinaface(detect_vision_frames)
 
-	for index, feature_stride in enumerate(feature_strides):
-		keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		face_detections = []
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_box_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
-
-			for bounding_box in distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box[0] * ratio_width,
-					bounding_box[1] * ratio_height,
-					bounding_box[2] * ratio_width,
-					bounding_box[3] * ratio_height,
-				]))
-
-			for score in detection[index][keep_indices]:
-				face_scores.append(score[0])
-
-			for face_landmark_5 in distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_5 * [ ratio_width, ratio_height ])
+		for index, feature_stride in enumerate(feature_strides):
+			keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
 
-	return bounding_boxes, face_scores, face_landmarks_5
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_box_raw = detection[index + feature_map_channel] * feature_stride
+				face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+				bounding_boxes = distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices] * [ ratio_width, ratio_height, ratio_width, ratio_height ]
+				face_scores = detection[index][keep_indices][:, 0]
+				face_landmarks_5 = distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices] * [ ratio_width, ratio_height ]
+				face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
+
+		batch_detections.append(merge_face_detections(face_detections))
+	return batch_detections
 
 
-def detect_with_scrfd(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+def detect_with_scrfd(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
+	batch_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_scrfd(detect_vision_frame)
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detections = forward_with_scrfd(detect_vision_frames)
 
-	for index, feature_stride in enumerate(feature_strides):
-		keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		face_detections = []
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_box_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
-
-			for bounding_box in distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box[0] * ratio_width,
-					bounding_box[1] * ratio_height,
-					bounding_box[2] * ratio_width,
-					bounding_box[3] * ratio_height,
-				]))
-
-			for score in detection[index][keep_indices]:
-				face_scores.append(score[0])
-
-			for face_landmark_5 in distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_5 * [ ratio_width, ratio_height ])
+		for index, feature_stride in enumerate(feature_strides):
+			keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
 
-	return bounding_boxes, face_scores, face_landmarks_5
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_box_raw = detection[index + feature_map_channel] * feature_stride
+				face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+				bounding_boxes = distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices] * [ ratio_width, ratio_height, ratio_width, ratio_height ]
+				face_scores = detection[index][keep_indices][:, 0]
+				face_landmarks_5 = distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices] * [ ratio_width, ratio_height ]
+				face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
 
+		batch_detections.append(merge_face_detections(face_detections))
+	return batch_detections
 
-def detect_with_yoloface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_yoloface(detect_vision_frame)
-	detection = numpy.squeeze(detection).T
-	bounding_box_raw, score_raw, face_landmark_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
-	keep_indices = numpy.where(score_raw > state_manager.get_item('face_detector_score'))[0]
-
-	if numpy.any(keep_indices):
-		bounding_box_raw, face_landmark_5_raw, score_raw = bounding_box_raw[keep_indices], face_landmark_5_raw[keep_indices], score_raw[keep_indices]
-
-		for bounding_box in bounding_box_raw:
-			bounding_boxes.append(numpy.array(
+
+def detect_with_yoloface(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
+	batch_detections = []
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size)
+	detections = forward_with_yoloface(detect_vision_frames)
+
+	for detection, (ratio_width, ratio_height) in zip(detections, detect_ratios):
+		face_detections = []
+		detection = numpy.squeeze(detection).T
+		bounding_box_raw, score_raw, face_landmark_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
+		keep_indices = numpy.where(score_raw > state_manager.get_item('face_detector_score'))[0]
+
+		if numpy.any(keep_indices):
+			bounding_box_raw, face_landmark_5_raw, score_raw = bounding_box_raw[keep_indices], face_landmark_5_raw[keep_indices], score_raw[keep_indices]
+			center_x, center_y, width, height = bounding_box_raw.T
+			bounding_boxes = numpy.column_stack(
 			[
-				(bounding_box[0] - bounding_box[2] / 2) * ratio_width,
-				(bounding_box[1] - bounding_box[3] / 2) * ratio_height,
-				(bounding_box[0] + bounding_box[2] / 2) * ratio_width,
-				(bounding_box[1] + bounding_box[3] / 2) * ratio_height,
-			]))
+				(center_x - width / 2) * ratio_width,
+				(center_y - height / 2) * ratio_height,
+				(center_x + width / 2) * ratio_width,
+				(center_y + height / 2) * ratio_height
+			])
+			face_scores = score_raw.ravel()
+			face_landmarks_5 = face_landmark_5_raw.reshape(-1, 5, 3)[:, :, :2] * [ ratio_width, ratio_height ]
+			face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
 
-		face_scores = score_raw.ravel().tolist()
-		face_landmark_5_raw[:, 0::3] = (face_landmark_5_raw[:, 0::3]) * ratio_width
-		face_landmark_5_raw[:, 1::3] = (face_landmark_5_raw[:, 1::3]) * ratio_height
+		batch_detections.append(merge_face_detections(face_detections))
+	return batch_detections
 
-		for face_landmark_5 in face_landmark_5_raw:
-			face_landmarks_5.append(numpy.array(face_landmark_5.reshape(-1, 3)[:, :2]))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+def forward_with_retinaface(detect_vision_frames : VisionFrame) -> List[Detection]:
+	return forward_detections('retinaface', detect_vision_frames)
 
 
-def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('retinaface')
+def forward_with_scrfd(detect_vision_frames : VisionFrame) -> List[Detection]:
+	return forward_detections('scrfd', detect_vision_frames)
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
 
-	return detection
+def forward_with_yoloface(detect_vision_frames : VisionFrame) -> List[Detection]:
+	return forward_detections('yoloface', detect_vision_frames)
 
 
-def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('scrfd')
+def forward_detections(model_name : str, detect_vision_frames : VisionFrame) -> List[Detection]:
+	face_detector = get_inference_pool().get(model_name)
+	detections = []
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
+	if inference_manager.has_dynamic_batch(get_inference_pool(), model_name):
+		with thread_semaphore():
+			detection = face_detector.run(None,
+			{
+				'input': detect_vision_frames
+			})
+
+		return split_detection(detection, detect_vision_frames.shape[0])
 
-	return detection
+	for detect_vision_frame in detect_vision_frames:
+		with thread_semaphore():
+			detection = face_detector.run(None,
+			{
+				'input': numpy.expand_dims(detect_vision_frame, axis = 0)
+			})
+		detections.append(detection)
 
+	return detections
 
-def forward_with_yoloface(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('yoloface')
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
+def split_detection(detection : Detection, batch_total : int) -> List[Detection]:
+	detection = [ numpy.reshape(detection_output, (batch_total, -1) + detection_output.shape[-1:]) for detection_output in detection ]
+	return [ [ detection_output[index] for detection_output in detection ] for index in range(batch_total) ]
+
+
+def prepare_detect_frames(vision_frames : List[VisionFrame], face_detector_size : str) -> Tuple[VisionFrame, List[Tuple[float, float]]]:
+	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
+	detect_vision_frames = []
+	detect_ratios = []
+
+	for vision_frame in vision_frames:
+		temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
+		detect_ratios.append((vision_frame.shape[1] / temp_vision_frame.shape[1], vision_frame.shape[0] / temp_vision_frame.shape[0]))
+		detect_vision_frames.append(prepare_detect_frame(temp_vision_frame, face_detector_size))
 
-	return detection
+	return numpy.concatenate(detect_vision_frames), detect_ratios
 
 
 def prepare_detect_frame(temp_vision_frame : VisionFrame, face_detector_size : str) -> VisionFrame:
@@ -5,7 +5,7 @@ import cv2
 import numpy
 from cv2.typing import Size
 
-from facefusion.typing import Anchors, Angle, BoundingBox, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, Mask, Matrix, Points, Scale, Score, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
+from facefusion.typing import Anchors, Angle, BoundingBox, BoundingBoxes, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, FaceScores, Mask, Matrix, Points, Scale, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
 
 WARP_TEMPLATES : WarpTemplateSet =\
 {
@@ -100,16 +100,31 @@ def warp_face_by_translation(temp_vision_frame : VisionFrame, translation : Tran
 
 def paste_back(temp_vision_frame : VisionFrame, crop_vision_frame : VisionFrame, crop_mask : Mask, affine_matrix : Matrix) -> VisionFrame:
 	inverse_matrix = cv2.invertAffineTransform(affine_matrix)
-	temp_size = temp_vision_frame.shape[:2][::-1]
-	inverse_mask = cv2.warpAffine(crop_mask, inverse_matrix, temp_size).clip(0, 1)
-	inverse_vision_frame = cv2.warpAffine(crop_vision_frame, inverse_matrix, temp_size, borderMode = cv2.BORDER_REPLICATE)
+	x1, y1, x2, y2 = calc_paste_area(temp_vision_frame, crop_vision_frame, inverse_matrix)
 	paste_vision_frame = temp_vision_frame.copy()
-	paste_vision_frame[:, :, 0] = inverse_mask * inverse_vision_frame[:, :, 0] + (1 - inverse_mask) * temp_vision_frame[:, :, 0]
-	paste_vision_frame[:, :, 1] = inverse_mask * inverse_vision_frame[:, :, 1] + (1 - inverse_mask) * temp_vision_frame[:, :, 1]
-	paste_vision_frame[:, :, 2] = inverse_mask * inverse_vision_frame[:, :, 2] + (1 - inverse_mask) * temp_vision_frame[:, :, 2]
+
+	if x2 > x1 and y2 > y1:
+		paste_width = x2 - x1
+		paste_height = y2 - y1
+		inverse_matrix[:, 2] -= [ x1, y1 ]
+		inverse_mask = cv2.warpAffine(crop_mask, inverse_matrix, (paste_width, paste_height)).clip(0, 1)
+		inverse_mask = numpy.expand_dims(inverse_mask, axis = -1)
+		inverse_vision_frame = cv2.warpAffine(crop_vision_frame, inverse_matrix, (paste_width, paste_height), borderMode = cv2.BORDER_REPLICATE)
+		temp_paste_frame = temp_vision_frame[y1:y2, x1:x2]
+		paste_vision_frame[y1:y2, x1:x2] = inverse_mask * inverse_vision_frame + (1 - inverse_mask) * temp_paste_frame
 	return paste_vision_frame
 
 
+def calc_paste_area(temp_vision_frame : VisionFrame, crop_vision_frame : VisionFrame, inverse_matrix : Matrix) -> Tuple[int, int, int, int]:
+	temp_height, temp_width = temp_vision_frame.shape[:2]
+	crop_height, crop_width = crop_vision_frame.shape[:2]
+	crop_points = numpy.array([ [ 0, 0 ], [ crop_width, 0 ], [ crop_width, crop_height ], [ 0, crop_height ] ]).astype(numpy.float32)
+	paste_points = cv2.transform(crop_points.reshape(-1, 1, 2), inverse_matrix).reshape(-1, 2)
+	x1, y1 = numpy.floor(paste_points.min(axis = 0)).astype(int) - 1
+	x2, y2 = numpy.ceil(paste_points.max(axis = 0)).astype(int) + 1
+	return max(x1, 0), max(y1, 0), min(x2, temp_width), min(y2, temp_height)
+
+
 @lru_cache(maxsize = None)
 def create_static_anchors(feature_stride : int, anchor_total : int, stride_height : int, stride_width : int) -> Anchors:
 	y, x = numpy.mgrid[:stride_height, :stride_width][::-1]
@@ -141,6 +156,11 @@ def normalize_bounding_box(bounding_box : BoundingBox) -> BoundingBox:
 	return numpy.array([ x1, y1, x2, y2 ])
 
 
+def normalize_bounding_boxes(bounding_boxes : BoundingBoxes) -> BoundingBoxes:
+	x1, y1, x2, y2 = bounding_boxes.T
+	return numpy.column_stack([ numpy.minimum(x1, x2), numpy.minimum(y1, y2), numpy.maximum(x1, x2), numpy.maximum(y1, y2) ])
+
+
 def transform_points(points : Points, matrix : Matrix) -> Points:
 	points = points.reshape(-1, 1, 2)
 	points = cv2.transform(points, matrix) #type:ignore[assignment]
@@ -162,6 +182,13 @@ def transform_bounding_box(bounding_box : BoundingBox, matrix : Matrix) -> Bound
 	return normalize_bounding_box(numpy.array([ x1, y1, x2, y2 ]))
 
 
+def transform_bounding_boxes(bounding_boxes : BoundingBoxes, matrix : Matrix) -> BoundingBoxes:
+	x1, y1, x2, y2 = bounding_boxes.T
+	points = numpy.stack([ x1, y1, x2, y1, x2, y2, x1, y2 ], axis = -1).reshape(-1, 4, 2)
+	points = transform_points(points, matrix).reshape(-1, 4, 2)
+	return numpy.concatenate([ numpy.min(points, axis = 1), numpy.max(points, axis = 1) ], axis = 1)
+
+
 def distance_to_bounding_box(points : Points, distance : Distance) -> BoundingBox:
 	x1 = points[:, 0] - distance[:, 0]
 	y1 = points[:, 1] - distance[:, 1]
@@ -208,9 +235,10 @@ def estimate_face_angle(face_landmark_68 : FaceLandmark68) -> Angle:
 	return face_angle
 
 
-def apply_nms(bounding_boxes : List[BoundingBox], face_scores : List[Score], score_threshold : float, nms_threshold : float) -> Sequence[int]:
-	normed_bounding_boxes = [ (x1, y1, x2 - x1, y2 - y1) for (x1, y1, x2, y2) in bounding_boxes ]
-	keep_indices = cv2.dnn.NMSBoxes(normed_bounding_boxes, face_scores, score_threshold = score_threshold, nms_threshold = nms_threshold)
+def apply_nms(bounding_boxes : BoundingBoxes, face_scores : FaceScores, score_threshold : float, nms_threshold : float) -> Sequence[int]:
+	x1, y1, x2, y2 = bounding_boxes.T
+	normed_bounding_boxes = numpy.column_stack([ x1, y1, x2 - x1, y2 - y1 ])
+	keep_indices = cv2.dnn.NMSBoxes(normed_bounding_boxes.tolist(), face_scores.tolist(), score_threshold = score_threshold, nms_threshold = nms_threshold)
 	return keep_indices
 
 
@@ -1,15 +1,17 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import Any, List, Tuple
 
 import cv2
 import numpy
+from cv2.typing import Size
+from numpy.typing import NDArray
 
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotated_matrix_and_size, estimate_matrix_by_face_landmark_5, transform_points, warp_face_by_translation
 from facefusion.filesystem import resolve_relative_path
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import Angle, BoundingBox, DownloadScope, DownloadSet, FaceLandmark5, FaceLandmark68, InferencePool, ModelSet, Prediction, Score, VisionFrame
+from facefusion.typing import Angle, BoundingBox, DownloadScope, DownloadSet, FaceLandmark68, FaceLandmarks5, FaceLandmarks68, InferencePool, Matrix, ModelSet, Prediction, Score, VisionFrame
 
 
 @lru_cache(maxsize = None)
@@ -115,59 +117,82 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hashes) and conditional_download_sources(model_sources)
 
 
-def detect_face_landmarks(vision_frame : VisionFrame, bounding_box : BoundingBox, face_angle : Angle) -> Tuple[FaceLandmark68, Score]:
-	face_landmark_2dfan4 = None
-	face_landmark_peppa_wutz = None
-	face_landmark_score_2dfan4 = 0.0
-	face_landmark_score_peppa_wutz = 0.0
+def detect_batch_face_landmarks(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
+	face_landmarks_68 = []
+	face_landmark_scores_68 = []
+	face_landmarks_2dfan4 = [ None ] * len(bounding_boxes)
+	face_landmarks_peppa_wutz = [ None ] * len(bounding_boxes)
+	face_landmark_scores_2dfan4 = [ 0.0 ] * len(bounding_boxes)
+	face_landmark_scores_peppa_wutz = [ 0.0 ] * len(bounding_boxes)
 
 	if state_manager.get_item('face_landmarker_model') in [ 'many', '2dfan4' ]:
-		face_landmark_2dfan4, face_landmark_score_2dfan4 = detect_with_2dfan4(vision_frame, bounding_box, face_angle)
+		face_landmarks_2dfan4, face_landmark_scores_2dfan4 = detect_with_2dfan4(vision_frame, bounding_boxes, face_angles)
 
 	if state_manager.get_item('face_landmarker_model') in [ 'many', 'peppa_wutz' ]:
-		face_landmark_peppa_wutz, face_landmark_score_peppa_wutz = detect_with_peppa_wutz(vision_frame, bounding_box, face_angle)
+		face_landmarks_peppa_wutz, face_landmark_scores_peppa_wutz = detect_with_peppa_wutz(vision_frame, bounding_boxes, face_angles)
 
-	if face_landmark_score_2dfan4 > face_landmark_score_peppa_wutz - 0.2:
-		return face_landmark_2dfan4, face_landmark_score_2dfan4
-	return face_landmark_peppa_wutz, face_landmark_score_peppa_wutz
+	for face_landmark_2dfan4, face_landmark_score_2dfan4, face_landmark_peppa_wutz, face_landmark_score_peppa_wutz in zip(face_landmarks_2dfan4, face_landmark_scores_2dfan4, face_landmarks_peppa_wutz, face_landmark_scores_peppa_wutz):
+		if face_landmark_score_2dfan4 > face_landmark_score_peppa_wutz - 0.2:
+			face_landmarks_68.append(face_landmark_2dfan4)
+			face_landmark_scores_68.append(face_landmark_score_2dfan4)
+		else:
+			face_landmarks_68.append(face_landmark_peppa_wutz)
+			face_landmark_scores_68.append(face_landmark_score_peppa_wutz)
+	return face_landmarks_68, face_landmark_scores_68
 
 
-def detect_with_2dfan4(temp_vision_frame: VisionFrame, bounding_box: BoundingBox, face_angle: Angle) -> Tuple[FaceLandmark68, Score]:
+def detect_with_2dfan4(temp_vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
 	model_size = create_static_model_set('full').get('2dfan4').get('size')
-	scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
-	translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
-	rotated_matrix, rotated_size = create_rotated_matrix_and_size(face_angle, model_size)
-	crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
-	crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotated_matrix, rotated_size)
-	crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1).astype(numpy.float32) / 255.0
-	face_landmark_68, face_heatmap = forward_with_2dfan4(crop_vision_frame)
-	face_landmark_68 = face_landmark_68[:, :, :2][0] / 64 * 256
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(rotated_matrix))
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(affine_matrix))
-	face_landmark_score_68 = numpy.amax(face_heatmap, axis = (2, 3))
-	face_landmark_score_68 = numpy.mean(face_landmark_score_68)
-	face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.9 ], [ 0, 1 ])
-	return face_landmark_68, face_landmark_score_68
-
-
-def detect_with_peppa_wutz(temp_vision_frame : VisionFrame, bounding_box : BoundingBox, face_angle : Angle) -> Tuple[FaceLandmark68, Score]:
+	crop_vision_frames, inverse_matrices = prepare_crop_frames(temp_vision_frame, bounding_boxes, face_angles, model_size)
+	face_landmarks_68 = []
+	face_landmark_scores_68 = []
+	predictions, face_heatmaps = forward_with_2dfan4(crop_vision_frames)
+
+	for prediction, face_heatmap, (rotated_inverse_matrix, affine_inverse_matrix) in zip(predictions, face_heatmaps, inverse_matrices):
+		face_landmark_68 = prediction[:, :2] / 64 * 256
+		face_landmark_68 = transform_points(face_landmark_68, rotated_inverse_matrix)
+		face_landmark_68 = transform_points(face_landmark_68, affine_inverse_matrix)
+		face_landmark_score_68 = numpy.amax(face_heatmap, axis = (1, 2))
+		face_landmark_score_68 = numpy.mean(face_landmark_score_68)
+		face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.9 ], [ 0, 1 ])
+		face_landmarks_68.append(face_landmark_68)
+		face_landmark_scores_68.append(face_landmark_score_68)
+	return face_landmarks_68, face_landmark_scores_68
+
+
+def detect_with_peppa_wutz(temp_vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
 	model_size = create_static_model_set('full').get('peppa_wutz').get('size')
-	scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
-	translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
-	rotated_matrix, rotated_size = create_rotated_matrix_and_size(face_angle, model_size)
-	crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
-	crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotated_matrix, rotated_size)
-	crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1).astype(numpy.float32) / 255.0
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	prediction = forward_with_peppa_wutz(crop_vision_frame)
-	face_landmark_68 = prediction.reshape(-1, 3)[:, :2] / 64 * model_size[0]
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(rotated_matrix))
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(affine_matrix))
-	face_landmark_score_68 = prediction.reshape(-1, 3)[:, 2].mean()
-	face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.95 ], [ 0, 1 ])
-	return face_landmark_68, face_landmark_score_68
+	crop_vision_frames, inverse_matrices = prepare_crop_frames(temp_vision_frame, bounding_boxes, face_angles, model_size)
+	face_landmarks_68 = []
+	face_landmark_scores_68 = []
+	predictions = forward_with_peppa_wutz(crop_vision_frames)
+
+	for prediction, (rotated_inverse_matrix, affine_inverse_matrix) in zip(predictions, inverse_matrices):
+		face_landmark_68 = prediction.reshape(-1, 3)[:, :2] / 64 * model_size[0]
+		face_landmark_68 = transform_points(face_landmark_68, rotated_inverse_matrix)
+		face_landmark_68 = transform_points(face_landmark_68, affine_inverse_matrix)
+		face_landmark_score_68 = prediction.reshape(-1, 3)[:, 2].mean()
+		face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.95 ], [ 0, 1 ])
+		face_landmarks_68.append(face_landmark_68)
+		face_landmark_scores_68.append(face_landmark_score_68)
+	return face_landmarks_68, face_landmark_scores_68
+
+
+def prepare_crop_frames(temp_vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_angles : List[Angle], model_size : Size) -> Tuple[VisionFrame, List[Tuple[Matrix, Matrix]]]:
+	crop_vision_frames = []
+	inverse_matrices = []
+
+	for bounding_box, face_angle in zip(bounding_boxes, face_angles):
+		scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
+		translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
+		rotated_matrix, rotated_size = create_rotated_matrix_and_size(face_angle, model_size)
+		crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
+		crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotated_matrix, rotated_size)
+		crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
+		crop_vision_frame = crop_vision_frame.transpose(2, 0, 1).astype(numpy.float32) / 255.0
+		crop_vision_frames.append(crop_vision_frame)
+		inverse_matrices.append((cv2.invertAffineTransform(rotated_matrix), cv2.invertAffineTransform(affine_matrix)))
+	return numpy.stack(crop_vision_frames), inverse_matrices
 
 
 def conditional_optimize_contrast(crop_vision_frame : VisionFrame) -> VisionFrame:
@@ -178,45 +203,44 @@ def conditional_optimize_contrast(crop_vision_frame : VisionFrame) -> VisionFram
 	return crop_vision_frame
 
 
-def estimate_face_landmark_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
-	affine_matrix = estimate_matrix_by_face_landmark_5(face_landmark_5, 'ffhq_512', (1, 1))
-	face_landmark_5 = cv2.transform(face_landmark_5.reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
-	face_landmark_68_5 = forward_fan_68_5(face_landmark_5)
-	face_landmark_68_5 = cv2.transform(face_landmark_68_5.reshape(1, -1, 2), cv2.invertAffineTransform(affine_matrix)).reshape(-1, 2)
-	return face_landmark_68_5
+def estimate_face_landmarks_68_5(face_landmarks_5 : FaceLandmarks5) -> List[FaceLandmark68]:
+	affine_matrices = [ estimate_matrix_by_face_landmark_5(face_landmark_5, 'ffhq_512', (1, 1)) for face_landmark_5 in face_landmarks_5 ]
+	face_landmarks_5 = numpy.stack([ cv2.transform(face_landmark_5.reshape(1, -1, 2), affine_matrix).reshape(-1, 2) for face_landmark_5, affine_matrix in zip(face_landmarks_5, affine_matrices) ]).astype(numpy.float32)
+	face_landmarks_68_5 = forward_fan_68_5(face_landmarks_5)
+	return [ cv2.transform(face_landmark_68_5.reshape(1, -1, 2), cv2.invertAffineTransform(affine_matrix)).reshape(-1, 2) for face_landmark_68_5, affine_matrix in zip(face_landmarks_68_5, affine_matrices) ]
 
 
-def forward_with_2dfan4(crop_vision_frame : VisionFrame) -> Tuple[Prediction, Prediction]:
-	face_landmarker = get_inference_pool().get('2dfan4')
+def forward_with_2dfan4(crop_vision_frames : VisionFrame) -> Tuple[Prediction, Prediction]:
+	predictions, face_heatmaps = forward_batch('2dfan4', crop_vision_frames)
+	return predictions, face_heatmaps
 
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': [ crop_vision_frame ]
-		})
 
-	return prediction
+def forward_with_peppa_wutz(crop_vision_frames : VisionFrame) -> Prediction:
+	return forward_batch('peppa_wutz', crop_vision_frames)[0]
 
 
-def forward_with_peppa_wutz(crop_vision_frame : VisionFrame) -> Prediction:
-	face_landmarker = get_inference_pool().get('peppa_wutz')
+def forward_fan_68_5(face_landmarks_5 : FaceLandmarks5) -> FaceLandmarks68:
+	return forward_batch('fan_68_5', face_landmarks_5)[0]
 
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
 
-	return prediction
+def forward_batch(model_name : str, model_inputs : NDArray[Any]) -> List[Prediction]:
+	face_landmarker = get_inference_pool().get(model_name)
 
+	if inference_manager.has_dynamic_batch(get_inference_pool(), model_name):
+		with conditional_thread_semaphore():
+			return face_landmarker.run(None,
+			{
+				'input': model_inputs
+			})
 
-def forward_fan_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
-	face_landmarker = get_inference_pool().get('fan_68_5')
+	predictions = []
 
-	with conditional_thread_semaphore():
-		face_landmark_68_5 = face_landmarker.run(None,
-		{
-			'input': [ face_landmark_5 ]
-		})[0][0]
+	for model_input in model_inputs:
+		with conditional_thread_semaphore():
+			prediction = face_landmarker.run(None,
+			{
+				'input': numpy.expand_dims(model_input, axis = 0)
+			})
+		predictions.append(prediction)
 
-	return face_landmark_68_5
+	return [ numpy.concatenate(prediction_outputs) for prediction_outputs in zip(*predictions) ]
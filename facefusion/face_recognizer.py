@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
 
@@ -59,17 +59,27 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hashes) and conditional_download_sources(model_sources)
 
 
-def calc_embedding(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Embedding, Embedding]:
+def calc_embeddings(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> Tuple[List[Embedding], List[Embedding]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
-	crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame / 127.5 - 1
-	crop_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1).astype(numpy.float32)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	embedding = forward(crop_vision_frame)
-	embedding = embedding.ravel()
-	normed_embedding = embedding / numpy.linalg.norm(embedding)
-	return embedding, normed_embedding
+	crop_vision_frames = []
+
+	for face_landmark_5 in face_landmarks_5:
+		crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+		crop_vision_frame = crop_vision_frame / 127.5 - 1
+		crop_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1).astype(numpy.float32)
+		crop_vision_frames.append(crop_vision_frame)
+
+	embeddings = forward_batch(numpy.stack(crop_vision_frames))
+	embeddings = embeddings.reshape(len(crop_vision_frames), -1)
+	normed_embeddings = embeddings / numpy.linalg.norm(embeddings, axis = 1, keepdims = True)
+	return list(embeddings), list(normed_embeddings)
+
+
+def forward_batch(crop_vision_frames : VisionFrame) -> Embedding:
+	if inference_manager.has_dynamic_batch(get_inference_pool(), 'face_recognizer'):
+		return forward(crop_vision_frames)
+	return numpy.concatenate([ forward(numpy.expand_dims(crop_vision_frame, axis = 0)) for crop_vision_frame in crop_vision_frames ])
 
 
 def forward(crop_vision_frame : VisionFrame) -> Embedding:
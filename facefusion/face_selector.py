@@ -1,21 +1,25 @@
-from typing import List
+from typing import Any, List
 
 import numpy
+from numpy.typing import NDArray
 
 from facefusion import state_manager
-from facefusion.typing import Face, FaceSelectorOrder, FaceSet, Gender, Race
+from facefusion.typing import Embedding, Face, FaceAttribute, FaceSelectorOrder, FaceSet, Gender, Race
 
 
 def find_similar_faces(faces : List[Face], reference_faces : FaceSet, face_distance : float) -> List[Face]:
 	similar_faces : List[Face] = []
 
 	if faces and reference_faces:
+		normed_embeddings = stack_normed_embeddings(faces)
+
 		for reference_set in reference_faces:
-			if not similar_faces:
-				for reference_face in reference_faces[reference_set]:
-					for face in faces:
-						if compare_faces(face, reference_face, face_distance):
-							similar_faces.append(face)
+			if not similar_faces and reference_faces[reference_set]:
+				reference_normed_embeddings = stack_normed_embeddings(reference_faces[reference_set])
+				face_distances = calc_face_distances(normed_embeddings, reference_normed_embeddings)
+
+				for _, face_index in numpy.argwhere(face_distances < face_distance):
+					similar_faces.append(faces[face_index])
 	return similar_faces
 
 
@@ -30,6 +34,24 @@ def calc_face_distance(face : Face, reference_face : Face) -> float:
 	return 0
 
 
+def calc_face_distances(normed_embeddings : Embedding, reference_normed_embeddings : Embedding) -> NDArray[Any]:
+	return 1 - numpy.matmul(reference_normed_embeddings, normed_embeddings.T)
+
+
+def stack_normed_embeddings(faces : List[Face]) -> Embedding:
+	return numpy.stack([ numpy.full(512, numpy.nan) if face.normed_embedding is None else face.normed_embedding for face in faces ])
+
+
+def get_face_selector_attributes() -> List[FaceAttribute]:
+	face_attributes : List[FaceAttribute] = []
+
+	if state_manager.get_item('face_selector_mode') == 'reference':
+		face_attributes.append('embedding')
+	if state_manager.get_item('face_selector_gender') or state_manager.get_item('face_selector_race') or state_manager.get_item('face_selector_age_start') is not None or state_manager.get_item('face_selector_age_end') is not None:
+		face_attributes.append('classification')
+	return face_attributes
+
+
 def sort_and_filter_faces(faces : List[Face]) -> List[Face]:
 	if faces:
 		if state_manager.get_item('face_selector_order'):
@@ -38,7 +60,7 @@ def sort_and_filter_faces(faces : List[Face]) -> List[Face]:
 			faces = filter_faces_by_gender(faces, state_manager.get_item('face_selector_gender'))
 		if state_manager.get_item('face_selector_race'):
 			faces = filter_faces_by_race(faces, state_manager.get_item('face_selector_race'))
-		if state_manager.get_item('face_selector_age_start') or state_manager.get_item('face_selector_age_end'):
+		if state_manager.get_item('face_selector_age_start') is not None or state_manager.get_item('face_selector_age_end') is not None:
 			faces = filter_faces_by_age(faces, state_manager.get_item('face_selector_age_start'), state_manager.get_item('face_selector_age_end'))
 	return faces
 
@@ -1,40 +1,95 @@
 import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 
 import numpy
 
-from facefusion.typing import Face, FaceSet, FaceStore, VisionFrame
+from facefusion import state_manager
+from facefusion.typing import Face, FaceSet, FaceStore, FaceStoreStatistics, FrameHashFunction, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {},
+	'static_faces': OrderedDict(),
 	'reference_faces': {}
 }
+FACE_STORE_STATISTICS : FaceStoreStatistics =\
+{
+	'hits': 0,
+	'misses': 0,
+	'evictions': 0,
+	'memory_usage': 0
+}
+FACE_STORE_LOCK : threading.Lock = threading.Lock()
+FRAME_HASH_FUNCTION : FrameHashFunction = hashlib.sha1
 
 
 def get_face_store() -> FaceStore:
 	return FACE_STORE
 
 
+def get_face_store_statistics() -> FaceStoreStatistics:
+	return FACE_STORE_STATISTICS
+
+
 def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
 	frame_hash = create_frame_hash(vision_frame)
-	if frame_hash in FACE_STORE['static_faces']:
-		return FACE_STORE['static_faces'][frame_hash]
+
+	with FACE_STORE_LOCK:
+		if frame_hash in FACE_STORE['static_faces']:
+			FACE_STORE['static_faces'].move_to_end(frame_hash)
+			FACE_STORE_STATISTICS['hits'] += 1
+			return FACE_STORE['static_faces'][frame_hash]
+		FACE_STORE_STATISTICS['misses'] += 1
 	return None
 
 
 def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	frame_hash = create_frame_hash(vision_frame)
-	if frame_hash:
-		FACE_STORE['static_faces'][frame_hash] = faces
+	if numpy.any(vision_frame):
+		frame_hash = create_frame_hash(vision_frame)
+
+		with FACE_STORE_LOCK:
+			if frame_hash in FACE_STORE['static_faces']:
+				FACE_STORE_STATISTICS['memory_usage'] -= calc_faces_memory(FACE_STORE['static_faces'].pop(frame_hash))
+			FACE_STORE['static_faces'][frame_hash] = faces
+			FACE_STORE_STATISTICS['memory_usage'] += calc_faces_memory(faces)
+			evict_static_faces()
+
+
+def evict_static_faces() -> None:
+	face_store_memory_limit = (state_manager.get_item('face_store_memory_limit') or 0) * 1024 ** 2
+
+	while face_store_memory_limit and FACE_STORE_STATISTICS['memory_usage'] > face_store_memory_limit and len(FACE_STORE['static_faces']) > 1:
+		_, faces = FACE_STORE['static_faces'].popitem(last = False)
+		FACE_STORE_STATISTICS['memory_usage'] -= calc_faces_memory(faces)
+		FACE_STORE_STATISTICS['evictions'] += 1
+
+
+def calc_faces_memory(faces : List[Face]) -> int:
+	faces_memory = 0
+
+	for face in faces:
+		faces_memory += face.bounding_box.nbytes
+		faces_memory += sum(face_embedding.nbytes for face_embedding in [ face.embedding, face.normed_embedding ] if face_embedding is not None)
+		faces_memory += sum(face_landmark.nbytes for face_landmark in face.landmark_set.values())
+	return faces_memory
 
 
 def clear_static_faces() -> None:
-	FACE_STORE['static_faces'] = {}
+	with FACE_STORE_LOCK:
+		FACE_STORE['static_faces'] = OrderedDict()
+		FACE_STORE_STATISTICS['memory_usage'] = 0
+
+
+def set_frame_hash_function(frame_hash_function : FrameHashFunction) -> None:
+	global FRAME_HASH_FUNCTION
+
+	FRAME_HASH_FUNCTION = frame_hash_function
+	clear_static_faces()
 
 
-def create_frame_hash(vision_frame : VisionFrame) -> Optional[str]:
-	return hashlib.sha1(vision_frame.tobytes()).hexdigest() if numpy.any(vision_frame) else None
+def create_frame_hash(vision_frame : VisionFrame) -> str:
+	return FRAME_HASH_FUNCTION(numpy.ascontiguousarray(vision_frame)).hexdigest()
 
 
 def get_reference_faces() -> Optional[FaceSet]:
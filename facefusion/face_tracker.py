@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_helper import convert_to_face_landmark_5
+from facefusion.face_landmarker import detect_batch_face_landmarks, estimate_face_landmarks_68_5
+from facefusion.scene_detector import has_scene_cut
+from facefusion.typing import BoundingBox, Face, FaceLandmark68, FaceLandmarkSet, FaceScoreSet, FaceTracker, VisionFrame
+
+FACE_TRACKER : FaceTracker =\
+{
+	'anchor_faces': OrderedDict()
+}
+FACE_TRACKER_LOCK : threading.Lock = threading.Lock()
+FACE_TRACKER_LIMIT = 256
+
+
+def has_face_tracking() -> bool:
+	return (state_manager.get_item('face_tracker_interval') or 1) > 1
+
+
+def get_tracked_faces(frame_number : int, vision_frame : VisionFrame) -> Optional[List[Face]]:
+	anchor_faces = find_anchor_faces(frame_number)
+
+	if anchor_faces:
+		return track_faces(vision_frame, anchor_faces)
+	return None
+
+
+def find_anchor_faces(frame_number : int) -> Optional[List[Face]]:
+	if has_face_tracking():
+		with FACE_TRACKER_LOCK:
+			for anchor_frame_number in range(frame_number - 1, frame_number - state_manager.get_item('face_tracker_interval'), -1):
+				if anchor_frame_number in FACE_TRACKER.get('anchor_faces'):
+					if has_scene_cut(anchor_frame_number, frame_number):
+						return None
+					return FACE_TRACKER.get('anchor_faces').get(anchor_frame_number)
+	return None
+
+
+def set_anchor_faces(frame_number : int, faces : List[Face]) -> None:
+	if has_face_tracking():
+		with FACE_TRACKER_LOCK:
+			FACE_TRACKER['anchor_faces'][frame_number] = faces
+
+			while len(FACE_TRACKER.get('anchor_faces')) > FACE_TRACKER_LIMIT:
+				FACE_TRACKER.get('anchor_faces').popitem(last = False)
+
+
+def clear_face_tracker() -> None:
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKER['anchor_faces'].clear()
+
+
+def track_faces(vision_frame : VisionFrame, anchor_faces : List[Face]) -> Optional[List[Face]]:
+	bounding_boxes = [ anchor_face.bounding_box for anchor_face in anchor_faces ]
+	face_angles = [ anchor_face.angle for anchor_face in anchor_faces ]
+	face_landmarks_68, face_landmark_scores_68 = detect_batch_face_landmarks(vision_frame, bounding_boxes, face_angles)
+
+	if all(face_landmark_score_68 > 0 and face_landmark_score_68 >= state_manager.get_item('face_landmarker_score') for face_landmark_score_68 in face_landmark_scores_68):
+		face_landmarks_5_68 = [ convert_to_face_landmark_5(face_landmark_68) for face_landmark_68 in face_landmarks_68 ]
+		face_landmarks_68_5 = estimate_face_landmarks_68_5(numpy.stack(face_landmarks_5_68))
+		tracked_faces = []
+
+		for anchor_face, face_landmark_68, face_landmark_score_68, face_landmark_5_68, face_landmark_68_5 in zip(anchor_faces, face_landmarks_68, face_landmark_scores_68, face_landmarks_5_68, face_landmarks_68_5):
+			face_landmark_set : FaceLandmarkSet =\
+			{
+				'5': face_landmark_5_68,
+				'5/68': face_landmark_5_68,
+				'68': face_landmark_68,
+				'68/5': face_landmark_68_5
+			}
+			face_score_set : FaceScoreSet =\
+			{
+				'detector': anchor_face.score_set.get('detector'),
+				'landmarker': face_landmark_score_68
+			}
+			tracked_faces.append(anchor_face._replace(
+				bounding_box = move_bounding_box(anchor_face, face_landmark_68),
+				score_set = face_score_set,
+				landmark_set = face_landmark_set
+			))
+		return tracked_faces
+	return None
+
+
+def move_bounding_box(anchor_face : Face, face_landmark_68 : FaceLandmark68) -> BoundingBox:
+	anchor_face_landmark_68 = anchor_face.landmark_set.get('68')
+	anchor_center = numpy.mean(anchor_face_landmark_68, axis = 0)
+	face_center = numpy.mean(face_landmark_68, axis = 0)
+	face_scale = numpy.ptp(face_landmark_68, axis = 0).max() / max(numpy.ptp(anchor_face_landmark_68, axis = 0).max(), 1)
+	bounding_box = numpy.reshape(anchor_face.bounding_box, (2, 2))
+	return ((bounding_box - anchor_center) * face_scale + face_center).ravel()
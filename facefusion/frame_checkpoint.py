@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+from itertools import islice
+from typing import List, Optional
+
+from facefusion import state_manager
+from facefusion.filesystem import create_directory, is_file
+from facefusion.jobs import job_store
+from facefusion.temp_helper import get_temp_directory_path, get_temp_frame_paths
+from facefusion.typing import FrameCheckpoint, FrameCheckpointContent, ProcessFrames, QueuePayload, UpdateProgress
+
+FRAME_CHECKPOINT_IGNORE_KEYS =\
+[
+	'output_path',
+	'output_image_quality',
+	'output_image_resolution',
+	'output_audio_encoder',
+	'output_video_encoder',
+	'output_video_preset',
+	'output_video_quality',
+	'skip_audio',
+	'keep_temp',
+	'content_analyser_mode',
+	'content_analyser_stride',
+	'content_analyser_batch_size'
+]
+
+
+def get_frame_checkpoint_path(target_path : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'checkpoint.jsonl')
+
+
+def get_frame_staging_path(target_path : str, processors : List[str], frame_path : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'checkpoint', '-'.join(processors), os.path.basename(frame_path))
+
+
+def create_checkpoint_hash(target_path : str) -> str:
+	settings =\
+	[
+		os.path.getsize(target_path),
+		os.path.getmtime(target_path)
+	]
+
+	for step_key in job_store.get_step_keys():
+		if step_key not in FRAME_CHECKPOINT_IGNORE_KEYS:
+			settings.append((step_key, state_manager.get_item(step_key))) #type:ignore[arg-type]
+	return hashlib.blake2b(repr(settings).encode(), digest_size = 8).hexdigest()
+
+
+def create_frame_checkpoint(target_path : str) -> bool:
+	frame_checkpoint_path = get_frame_checkpoint_path(target_path)
+
+	with open(frame_checkpoint_path, 'w') as frame_checkpoint_file:
+		frame_checkpoint_file.write(json.dumps({ 'checkpoint_hash': create_checkpoint_hash(target_path) }) + '\n')
+	return is_file(frame_checkpoint_path)
+
+
+def read_frame_checkpoint(target_path : str) -> Optional[FrameCheckpoint]:
+	frame_checkpoint_path = get_frame_checkpoint_path(target_path)
+
+	if is_file(frame_checkpoint_path):
+		frame_checkpoint : FrameCheckpoint =\
+		{
+			'checkpoint_hash': None,
+			'frame_total': None,
+			'content_analysed': False,
+			'processors': {}
+		}
+
+		with open(frame_checkpoint_path, 'r') as frame_checkpoint_file:
+			for line in frame_checkpoint_file:
+				try:
+					content = json.loads(line)
+				except ValueError:
+					continue
+				if 'checkpoint_hash' in content:
+					frame_checkpoint['checkpoint_hash'] = content.get('checkpoint_hash')
+				if 'frame_total' in content:
+					frame_checkpoint['frame_total'] = content.get('frame_total')
+				if 'content_analysed' in content:
+					frame_checkpoint['content_analysed'] = content.get('content_analysed')
+				if 'frame_number' in content:
+					for processor in content.get('processors'):
+						frame_checkpoint['processors'].setdefault(processor, set()).add(content.get('frame_number'))
+		return frame_checkpoint
+	return None
+
+
+def append_frame_checkpoint(target_path : str, content : FrameCheckpointContent) -> bool:
+	frame_checkpoint_path = get_frame_checkpoint_path(target_path)
+
+	if is_file(frame_checkpoint_path):
+		frame_checkpoint_descriptor = os.open(frame_checkpoint_path, os.O_WRONLY | os.O_APPEND)
+
+		try:
+			os.write(frame_checkpoint_descriptor, (json.dumps(content) + '\n').encode())
+		finally:
+			os.close(frame_checkpoint_descriptor)
+		return True
+	return False
+
+
+def resume_frame_checkpoint(target_path : str) -> bool:
+	frame_checkpoint = read_frame_checkpoint(target_path)
+
+	if frame_checkpoint and frame_checkpoint.get('checkpoint_hash') == create_checkpoint_hash(target_path):
+		return frame_checkpoint.get('frame_total') == len(get_temp_frame_paths(target_path))
+	return False
+
+
+def set_frame_total(target_path : str, frame_total : int) -> bool:
+	return append_frame_checkpoint(target_path, { 'frame_total': frame_total })
+
+
+def has_analysed_content(target_path : str) -> bool:
+	frame_checkpoint = read_frame_checkpoint(target_path)
+	return frame_checkpoint is not None and frame_checkpoint.get('content_analysed')
+
+
+def set_analysed_content(target_path : str) -> bool:
+	return append_frame_checkpoint(target_path, { 'content_analysed': True })
+
+
+def set_processed_frame(target_path : str, processors : List[str], frame_number : int) -> bool:
+	return append_frame_checkpoint(target_path, { 'processors': processors, 'frame_number': frame_number })
+
+
+def filter_queue_payloads(target_path : str, queue_payloads : List[QueuePayload], processors : List[str]) -> List[QueuePayload]:
+	frame_checkpoint = read_frame_checkpoint(target_path)
+
+	if frame_checkpoint:
+		processed_frame_numbers = set.intersection(*[ frame_checkpoint.get('processors').get(processor, set()) for processor in processors ])
+
+		for queue_payload in queue_payloads:
+			if queue_payload.get('frame_number') in processed_frame_numbers:
+				commit_staged_frame(target_path, processors, queue_payload)
+		return [ queue_payload for queue_payload in queue_payloads if queue_payload.get('frame_number') not in processed_frame_numbers ]
+	return queue_payloads
+
+
+def stage_queue_payload(target_path : str, processors : List[str], queue_payload : QueuePayload) -> QueuePayload:
+	return\
+	{
+		'frame_number': queue_payload.get('frame_number'),
+		'frame_path': queue_payload.get('frame_path'),
+		'output_frame_path': get_frame_staging_path(target_path, processors, queue_payload.get('frame_path'))
+	}
+
+
+def commit_staged_frame(target_path : str, processors : List[str], queue_payload : QueuePayload) -> bool:
+	frame_staging_path = get_frame_staging_path(target_path, processors, queue_payload.get('frame_path'))
+
+	if is_file(frame_staging_path):
+		os.replace(frame_staging_path, queue_payload.get('frame_path'))
+		return True
+	return False
+
+
+def process_checkpoint_frames(process_frames : ProcessFrames, processors : List[str], source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+	target_path = state_manager.get_item('target_path')
+	queue_iterator = iter(queue_payloads)
+
+	def update_checkpoint(total : int) -> None:
+		for queue_payload in islice(queue_iterator, total):
+			set_processed_frame(target_path, processors, queue_payload.get('frame_number'))
+			commit_staged_frame(target_path, processors, queue_payload)
+		update_progress(total)
+
+	stage_payloads = [ stage_queue_payload(target_path, processors, queue_payload) for queue_payload in queue_payloads ]
+	create_directory(os.path.dirname(get_frame_staging_path(target_path, processors, '')))
+	process_frames(source_paths, stage_payloads, update_checkpoint)
@@ -61,3 +61,8 @@ def create_inference_session(model_path : str, execution_device_id : str, execut
 def get_inference_context(model_context : str) -> str:
 	inference_context = model_context + '.' + '_'.join(state_manager.get_item('execution_providers'))
 	return inference_context
+
+
+def has_dynamic_batch(inference_pool : InferencePool, model_name : str) -> bool:
+	inference_session = inference_pool.get(model_name)
+	return all(not isinstance(model_input.shape[0], int) for model_input in inference_session.get_inputs())
@@ -1,15 +1,22 @@
 import os
 from copy import copy
-from typing import List, Optional
+from typing import Dict, List, Optional, TextIO
 
 import facefusion.choices
+from facefusion.common_helper import is_windows
 from facefusion.date_helper import get_current_date_time
 from facefusion.filesystem import create_directory, is_directory, is_file, move_file, remove_directory, remove_file, resolve_file_pattern
 from facefusion.jobs.job_helper import get_step_output_path
 from facefusion.json import read_json, write_json
 from facefusion.typing import Args, Job, JobSet, JobStatus, JobStep, JobStepStatus
 
+if is_windows():
+	import msvcrt
+else:
+	import fcntl
+
 JOBS_PATH : Optional[str] = None
+JOB_LOCKS : Dict[str, TextIO] = {}
 
 
 def init_jobs(jobs_path : str) -> bool:
@@ -74,6 +81,34 @@ def delete_jobs() -> bool:
 	return False
 
 
+def claim_job(job_id : str) -> bool:
+	job_lock_path = suggest_job_lock_path(job_id)
+
+	if job_lock_path and job_id not in JOB_LOCKS:
+		job_lock_file = open(job_lock_path, 'a')
+
+		try:
+			if is_windows():
+				msvcrt.locking(job_lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+			else:
+				fcntl.flock(job_lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+		except OSError:
+			job_lock_file.close()
+			return False
+		JOB_LOCKS[job_id] = job_lock_file
+		return True
+	return False
+
+
+def release_job(job_id : str) -> bool:
+	job_lock_file = JOB_LOCKS.pop(job_id, None)
+
+	if job_lock_file:
+		job_lock_file.close()
+		return True
+	return False
+
+
 def find_jobs(job_status : JobStatus) -> JobSet:
 	job_ids = find_job_ids(job_status)
 	jobs : JobSet = {}
@@ -230,6 +265,10 @@ def move_job_file(job_id : str, job_status : JobStatus) -> bool:
 
 def delete_job_file(job_id : str) -> bool:
 	job_path = find_job_path(job_id)
+	job_lock_path = suggest_job_lock_path(job_id)
+
+	if is_file(job_lock_path):
+		remove_file(job_lock_path)
 	return remove_file(job_path)
 
 
@@ -241,6 +280,12 @@ def suggest_job_path(job_id : str, job_status : JobStatus) -> Optional[str]:
 	return None
 
 
+def suggest_job_lock_path(job_id : str) -> Optional[str]:
+	if job_id:
+		return os.path.join(JOBS_PATH, job_id + '.lock')
+	return None
+
+
 def find_job_path(job_id : str) -> Optional[str]:
 	job_file_name = get_job_file_name(job_id)
 
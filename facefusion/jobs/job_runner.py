@@ -1,10 +1,32 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List
+
+from facefusion import logger, state_manager, wording
 from facefusion.ffmpeg import concat_video
 from facefusion.filesystem import is_image, is_video, move_file, remove_file
-from facefusion.jobs import job_helper, job_manager
+from facefusion.jobs import job_helper, job_manager, job_store
+from facefusion.memory import limit_system_memory
 from facefusion.typing import JobOutputSet, JobStep, ProcessStep
 
+JOB_WORKER : Dict[str, Any] =\
+{
+	'temp_path': None
+}
+
 
 def run_job(job_id : str, process_step : ProcessStep) -> bool:
+	if job_manager.claim_job(job_id):
+		try:
+			return run_queued_job(job_id, process_step)
+		finally:
+			job_manager.release_job(job_id)
+	return False
+
+
+def run_queued_job(job_id : str, process_step : ProcessStep) -> bool:
 	queued_job_ids = job_manager.find_job_ids('queued')
 
 	if job_id in queued_job_ids:
@@ -16,10 +38,12 @@ def run_job(job_id : str, process_step : ProcessStep) -> bool:
 	return False
 
 
-def run_jobs(process_step : ProcessStep) -> bool:
+def run_jobs(process_step : ProcessStep, job_worker_count : int = 1) -> bool:
 	queued_job_ids = job_manager.find_job_ids('queued')
 
 	if queued_job_ids:
+		if job_worker_count > 1:
+			return multi_run_jobs(run_job, queued_job_ids, process_step, job_worker_count)
 		for job_id in queued_job_ids:
 			if not run_job(job_id, process_step):
 				return False
@@ -28,17 +52,28 @@ def run_jobs(process_step : ProcessStep) -> bool:
 
 
 def retry_job(job_id : str, process_step : ProcessStep) -> bool:
+	if job_manager.claim_job(job_id):
+		try:
+			return retry_failed_job(job_id, process_step)
+		finally:
+			job_manager.release_job(job_id)
+	return False
+
+
+def retry_failed_job(job_id : str, process_step : ProcessStep) -> bool:
 	failed_job_ids = job_manager.find_job_ids('failed')
 
 	if job_id in failed_job_ids:
-		return job_manager.set_steps_status(job_id, 'queued') and job_manager.move_job_file(job_id, 'queued') and run_job(job_id, process_step)
+		return job_manager.set_steps_status(job_id, 'queued') and job_manager.move_job_file(job_id, 'queued') and run_queued_job(job_id, process_step)
 	return False
 
 
-def retry_jobs(process_step : ProcessStep) -> bool:
+def retry_jobs(process_step : ProcessStep, job_worker_count : int = 1) -> bool:
 	failed_job_ids = job_manager.find_job_ids('failed')
 
 	if failed_job_ids:
+		if job_worker_count > 1:
+			return multi_run_jobs(retry_job, failed_job_ids, process_step, job_worker_count)
 		for job_id in failed_job_ids:
 			if not retry_job(job_id, process_step):
 				return False
@@ -46,6 +81,56 @@ def retry_jobs(process_step : ProcessStep) -> bool:
 	return False
 
 
+def multi_run_jobs(run_method : Callable[[str, ProcessStep], bool], job_ids : List[str], process_step : ProcessStep, job_worker_count : int) -> bool:
+	process_context = multiprocessing.get_context('spawn')
+	pending_job_ids = deque(job_ids)
+	futures : Dict[Future[bool], str] = {}
+	is_run = True
+
+	with ProcessPoolExecutor(max_workers = job_worker_count, mp_context = process_context, initializer = init_job_worker, initargs = (dict(state_manager.get_state()), job_manager.JOBS_PATH, job_store.get_job_keys(), job_store.get_step_keys(), job_worker_count)) as executor:
+		while futures or pending_job_ids and is_run:
+			while len(futures) < job_worker_count and pending_job_ids and is_run:
+				job_id = pending_job_ids.popleft()
+				future = executor.submit(run_job_worker, run_method, job_id, process_step)
+				futures[future] = job_id
+
+			futures_done, _ = wait(futures, return_when = FIRST_COMPLETED)
+
+			for future_done in futures_done:
+				job_id = futures.pop(future_done)
+				try:
+					is_run = future_done.result() and is_run
+				except Exception as exception:
+					logger.error(wording.get('job_worker_failed').format(job_id = job_id), __name__)
+					logger.debug(str(exception), __name__)
+					job_manager.move_job_file(job_id, 'failed')
+					is_run = False
+	return is_run
+
+
+def init_job_worker(state : Dict[str, Any], jobs_path : str, job_keys : List[str], step_keys : List[str], job_worker_count : int) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	job_store.register_job_keys(job_keys)
+	job_store.register_step_keys(step_keys)
+	job_manager.init_jobs(jobs_path)
+	if state.get('execution_thread_count'):
+		state_manager.init_item('execution_thread_count', max(1, state.get('execution_thread_count') // job_worker_count))
+	if state.get('face_store_memory_limit'):
+		state_manager.init_item('face_store_memory_limit', max(1, state.get('face_store_memory_limit') // job_worker_count))
+	if state.get('system_memory_limit'):
+		limit_system_memory(max(1, state.get('system_memory_limit') // job_worker_count))
+	if state.get('log_level'):
+		logger.init(state.get('log_level'))
+	JOB_WORKER['temp_path'] = state.get('temp_path')
+
+
+def run_job_worker(run_method : Callable[[str, ProcessStep], bool], job_id : str, process_step : ProcessStep) -> bool:
+	if JOB_WORKER.get('temp_path'):
+		state_manager.set_item('temp_path', os.path.join(JOB_WORKER.get('temp_path'), job_id))
+	return run_method(job_id, process_step)
+
+
 def run_step(job_id : str, step_index : int, step : JobStep, process_step : ProcessStep) -> bool:
 	step_args = step.get('args')
 
@@ -1,22 +1,62 @@
 import importlib
+import math
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from queue import Empty, Queue
+from time import time
 from types import ModuleType
-from typing import Any, List
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Set, Tuple
 
+import numpy
 from tqdm import tqdm
 
-from facefusion import logger, state_manager, wording
+from facefusion import logger, process_manager, state_manager, wording
+from facefusion.audio import create_empty_audio_frame, get_voice_frame
+from facefusion.common_helper import get_first
+from facefusion.content_analyser import analyse_content_frame, flush_content_analysis, is_content_rejected
 from facefusion.exit_helper import hard_exit
-from facefusion.typing import ProcessFrames, QueuePayload
+from facefusion.face_analyser import get_average_face, get_many_faces
+from facefusion.face_cache import get_cached_faces, get_cached_frame_faces, set_cached_faces, set_cached_frame_faces
+from facefusion.face_selector import get_face_selector_attributes, sort_faces_by_order
+from facefusion.face_store import append_reference_face, get_reference_faces, get_static_faces, set_static_faces
+from facefusion.face_tracker import get_tracked_faces, has_face_tracking, set_anchor_faces
+from facefusion.ffmpeg import open_extract_stream, open_merge_stream, read_extract_stream
+from facefusion.filesystem import filter_audio_paths, filter_image_paths, is_file
+from facefusion.frame_checkpoint import filter_queue_payloads, get_frame_checkpoint_path, process_checkpoint_frames
+from facefusion.scene_detector import register_scene_frame
+from facefusion.typing import AudioFrame, ContentAnalysis, Face, FaceAttribute, FaceSet, Fps, ProcessFrames, QueuePayload, UpdateProgress, VisionFrame, WorkerUsage, WorkerUsageSet
+from facefusion.vision import count_trim_frame_total, pack_resolution, read_image, read_static_images, restrict_video_fps, write_image
 
+FACE_GEOMETRY_PROCESSORS =\
+[
+	'expression_restorer',
+	'face_editor',
+	'lip_syncer'
+]
+FACE_IDENTITY_PROCESSORS =\
+[
+	'age_modifier',
+	'deep_swapper',
+	'face_swapper'
+]
+PROCESS_FUTURE_FACTOR = 4
+PROCESS_WORKER : Dict[str, Any] =\
+{
+	'progress_queue': None,
+	'face_cache_queue': None
+}
 PROCESSORS_METHODS =\
 [
 	'get_inference_pool',
 	'clear_inference_pool',
 	'register_args',
 	'apply_args',
+	'get_face_attributes',
 	'pre_check',
 	'pre_process',
 	'post_process',
@@ -53,21 +93,133 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 	return processor_modules
 
 
+def collect_face_attributes(processors : List[str]) -> List[FaceAttribute]:
+	face_attributes = get_face_selector_attributes()
+
+	for processor_module in get_processors_modules(processors):
+		face_attributes.extend(processor_module.get_face_attributes())
+	return sorted(set(face_attributes))
+
+
 def multi_process_frames(source_paths : List[str], temp_frame_paths : List[str], process_frames : ProcessFrames) -> None:
+	target_path = state_manager.get_item('target_path')
 	queue_payloads = create_queue_payloads(temp_frame_paths)
+	start_time = time()
+
+	if is_file(get_frame_checkpoint_path(target_path)):
+		checkpoint_processors = resolve_checkpoint_processors(process_frames)
+		queue_payloads = filter_queue_payloads(target_path, queue_payloads, checkpoint_processors)
+		process_frames = partial(process_checkpoint_frames, process_frames, checkpoint_processors)
+		if len(queue_payloads) < len(temp_frame_paths):
+			logger.info(wording.get('resuming_frames').format(frame_total = len(temp_frame_paths) - len(queue_payloads)), __name__)
+
 	with tqdm(total = len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
-		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-			futures = []
-			queue : Queue[QueuePayload] = create_queue(queue_payloads)
-			queue_per_future = max(len(queue_payloads) // state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count'), 1)
+		queue : Queue[QueuePayload] = create_queue(queue_payloads)
+
+		if state_manager.get_item('execution_mode') == 'process':
+			worker_usage_set = multi_process_pool(source_paths, queue, process_frames, progress.update)
+		else:
+			worker_usage_set = multi_thread_pool(source_paths, queue, process_frames, progress.update)
+	log_worker_usages(worker_usage_set, time() - start_time)
+
+
+def resolve_checkpoint_processors(process_frames : ProcessFrames) -> List[str]:
+	if process_frames == process_fused_frames:
+		return state_manager.get_item('processors')
+	return [ process_frames.__module__.split('.')[-1] ]
+
+
+def multi_thread_pool(source_paths : List[str], queue : Queue[QueuePayload], process_frames : ProcessFrames, update_progress : UpdateProgress) -> WorkerUsageSet:
+	with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+		return schedule_queue(executor, source_paths, queue, process_frames, update_progress, lambda: None)
+
+
+def multi_process_pool(source_paths : List[str], queue : Queue[QueuePayload], process_frames : ProcessFrames, update_progress : UpdateProgress) -> WorkerUsageSet:
+	process_context = multiprocessing.get_context('spawn')
+	progress_queue = process_context.Queue()
+	face_cache_queue = process_context.Queue()
+
+	with ProcessPoolExecutor(max_workers = state_manager.get_item('execution_thread_count'), mp_context = process_context, initializer = init_process_worker, initargs = (dict(state_manager.get_state()), get_reference_faces(), get_cached_frame_faces(), progress_queue, face_cache_queue)) as executor:
+		worker_usage_set = schedule_queue(executor, source_paths, queue, process_frames, update_process_progress, lambda: forward_process_queues(progress_queue, face_cache_queue, update_progress))
+	forward_process_queues(progress_queue, face_cache_queue, update_progress)
+	return worker_usage_set
 
-			while not queue.empty():
-				future = executor.submit(process_frames, source_paths, pick_queue(queue, queue_per_future), progress.update)
-				futures.append(future)
 
-			for future_done in as_completed(futures):
-				future_done.result()
+def schedule_queue(executor : Executor, source_paths : List[str], queue : Queue[QueuePayload], process_frames : ProcessFrames, update_progress : UpdateProgress, forward_progress : Callable[[], None]) -> WorkerUsageSet:
+	future_limit = state_manager.get_item('execution_thread_count') * 2
+	queue_per_future = calc_queue_per_future(queue.qsize())
+	futures : Set[Future[WorkerUsage]] = set()
+	worker_usage_set : WorkerUsageSet = {}
+
+	while futures or not queue.empty() and process_manager.is_processing():
+		while len(futures) < future_limit and not queue.empty() and process_manager.is_processing():
+			future = executor.submit(measure_process_frames, process_frames, source_paths, pick_queue(queue, queue_per_future), update_progress)
+			futures.add(future)
+
+		futures_done, futures = wait(futures, timeout = 0.1, return_when = FIRST_COMPLETED)
+		forward_progress()
+
+		for future_done in futures_done:
+			worker_name, worker_time = future_done.result()
+			worker_usage_set[worker_name] = worker_usage_set.get(worker_name, 0) + worker_time
+	return worker_usage_set
+
+
+def calc_queue_per_future(queue_total : int) -> int:
+	future_total = state_manager.get_item('execution_thread_count') * PROCESS_FUTURE_FACTOR
+	return max(math.ceil(queue_total / future_total), state_manager.get_item('execution_queue_count'))
+
+
+def measure_process_frames(process_frames : ProcessFrames, source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> WorkerUsage:
+	start_time = time()
+	process_frames(source_paths, queue_payloads, update_progress)
+	worker_name = multiprocessing.current_process().name + '/' + threading.current_thread().name
+	return worker_name, time() - start_time
+
+
+def log_worker_usages(worker_usage_set : WorkerUsageSet, process_time : float) -> None:
+	if process_time > 0:
+		for worker_name, worker_time in sorted(worker_usage_set.items()):
+			worker_usage = round(worker_time / process_time * 100, 2)
+			logger.debug(wording.get('worker_usage').format(worker_name = worker_name, worker_usage = worker_usage, seconds = round(process_time, 2)), __name__)
+
+
+def init_process_worker(state : Dict[str, Any], reference_faces : Optional[FaceSet], cached_frame_faces : Dict[int, List[Face]], progress_queue : 'multiprocessing.Queue[int]', face_cache_queue : 'multiprocessing.Queue[Tuple[int, List[Face]]]') -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	if reference_faces:
+		for name, faces in reference_faces.items():
+			for face in faces:
+				append_reference_face(name, face)
+	set_cached_frame_faces(cached_frame_faces)
+	PROCESS_WORKER['progress_queue'] = progress_queue
+	PROCESS_WORKER['face_cache_queue'] = face_cache_queue
+	process_manager.start()
+
+
+def update_process_progress(total : int) -> None:
+	PROCESS_WORKER.get('progress_queue').put(total)
+
+
+def forward_process_queues(progress_queue : 'multiprocessing.Queue[int]', face_cache_queue : 'multiprocessing.Queue[Tuple[int, List[Face]]]', update_progress : UpdateProgress) -> None:
+	try:
+		while True:
+			update_progress(progress_queue.get_nowait())
+	except Empty:
+		pass
+	try:
+		while True:
+			set_cached_faces(*face_cache_queue.get_nowait())
+	except Empty:
+		pass
+
+
+def set_process_cached_faces(frame_number : int, faces : List[Face]) -> None:
+	set_cached_faces(frame_number, faces)
+
+	if PROCESS_WORKER.get('face_cache_queue') and state_manager.get_item('face_cache_path'):
+		PROCESS_WORKER.get('face_cache_queue').put((frame_number, faces))
 
 
 def create_queue(queue_payloads : List[QueuePayload]) -> Queue[QueuePayload]:
@@ -93,7 +245,154 @@ def create_queue_payloads(temp_frame_paths : List[str]) -> List[QueuePayload]:
 		frame_payload : QueuePayload =\
 		{
 			'frame_number': frame_number,
-			'frame_path': frame_path
+			'frame_path': frame_path,
+			'output_frame_path': frame_path
 		}
 		queue_payloads.append(frame_payload)
 	return queue_payloads
+
+
+def process_fused_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = create_source_face(source_paths)
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+
+	for queue_payload in process_manager.manage(queue_payloads):
+		frame_number = queue_payload.get('frame_number')
+		target_vision_path = queue_payload.get('frame_path')
+		output_vision_path = queue_payload.get('output_frame_path')
+		source_audio_frame = get_source_audio_frame(source_audio_path, temp_video_fps, frame_number)
+		target_vision_frame = read_image(target_vision_path)
+		output_vision_frame = process_frame_chain(frame_number, reference_faces, source_face, source_audio_frame, target_vision_frame)
+		write_image(output_vision_path, output_vision_frame)
+		update_progress(1)
+
+
+def multi_process_stream(source_paths : List[str], temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int, content_analysis : Optional[ContentAnalysis] = None) -> bool:
+	target_path = state_manager.get_item('target_path')
+	stream_frame_total = count_trim_frame_total(target_path, trim_frame_start, trim_frame_end)
+	extract_process = open_extract_stream(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+	merge_process = None
+	is_merge_broken = False
+
+	with tqdm(total = stream_frame_total, desc = wording.get('streaming'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+		for output_vision_frame in process_stream_frames(source_paths, extract_process, temp_video_resolution, temp_video_fps, content_analysis):
+			if not merge_process:
+				output_video_resolution = pack_resolution(output_vision_frame.shape[:2][::-1])
+				merge_process = open_merge_stream(target_path, output_video_resolution, state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps'))
+			try:
+				merge_process.stdin.write(output_vision_frame.tobytes())
+			except BrokenPipeError:
+				is_merge_broken = True
+				break
+			progress.update()
+
+	if is_merge_broken or not process_manager.is_processing() or is_content_rejected(content_analysis):
+		extract_process.terminate()
+		if merge_process:
+			merge_process.terminate()
+		return False
+	if merge_process:
+		merge_process.stdin.close()
+		return merge_process.wait() == 0 and extract_process.wait() == 0
+	return False
+
+
+def process_stream_frames(source_paths : List[str], extract_process : subprocess.Popen[bytes], temp_video_resolution : str, temp_video_fps : Fps, content_analysis : Optional[ContentAnalysis]) -> Generator[VisionFrame, None, None]:
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = create_source_face(source_paths)
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	future_limit = state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count')
+	futures : Deque[Future[VisionFrame]] = deque()
+
+	with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+		for frame_number, temp_vision_frame in enumerate(read_extract_stream(extract_process, temp_video_resolution)):
+			if not process_manager.is_processing():
+				break
+			if content_analysis and analyse_content_frame(content_analysis, frame_number, temp_vision_frame):
+				break
+			source_audio_frame = get_source_audio_frame(source_audio_path, temp_video_fps, frame_number)
+			future = executor.submit(process_frame_chain, frame_number, reference_faces, source_face, source_audio_frame, temp_vision_frame)
+			futures.append(future)
+
+			while len(futures) >= future_limit:
+				yield futures.popleft().result()
+
+		if content_analysis and flush_content_analysis(content_analysis):
+			return
+		while futures and process_manager.is_processing():
+			yield futures.popleft().result()
+
+
+def process_frame_chain(frame_number : int, reference_faces : FaceSet, source_face : Face, source_audio_frame : AudioFrame, target_vision_frame : VisionFrame) -> VisionFrame:
+	source_vision_frame = target_vision_frame.copy()
+	cached_faces = get_cached_faces(frame_number)
+	tracked_faces = None
+
+	if has_face_tracking():
+		register_scene_frame(frame_number, source_vision_frame)
+	if cached_faces:
+		set_static_faces(source_vision_frame, cached_faces)
+	else:
+		tracked_faces = get_tracked_faces(frame_number, source_vision_frame)
+		if tracked_faces:
+			set_static_faces(source_vision_frame, tracked_faces)
+
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	chain_faces = cached_faces or tracked_faces
+
+	for processor_index, processor_module in enumerate(processor_modules):
+		output_vision_frame = processor_module.process_frame(
+		{
+			'reference_faces': reference_faces,
+			'source_face': source_face,
+			'source_audio_frame': source_audio_frame,
+			'source_vision_frame': source_vision_frame,
+			'target_vision_frame': target_vision_frame
+		})
+		if processor_index < len(processor_modules) - 1 and keeps_face_geometry(processor_module, target_vision_frame, output_vision_frame):
+			chain_faces = forward_static_faces(chain_faces or get_static_faces(target_vision_frame), output_vision_frame)
+		else:
+			chain_faces = None
+		target_vision_frame = output_vision_frame
+
+	static_faces = get_static_faces(source_vision_frame)
+	if static_faces:
+		if not cached_faces:
+			set_process_cached_faces(frame_number, static_faces)
+		if not tracked_faces:
+			set_anchor_faces(frame_number, static_faces)
+	return target_vision_frame
+
+
+def keeps_face_geometry(processor_module : ModuleType, target_vision_frame : VisionFrame, output_vision_frame : VisionFrame) -> bool:
+	processor = processor_module.__name__.split('.')[-1]
+	return processor not in FACE_GEOMETRY_PROCESSORS + FACE_IDENTITY_PROCESSORS and target_vision_frame.shape == output_vision_frame.shape
+
+
+def forward_static_faces(static_faces : Optional[List[Face]], output_vision_frame : VisionFrame) -> Optional[List[Face]]:
+	if static_faces:
+		set_static_faces(output_vision_frame, static_faces)
+	return static_faces
+
+
+def create_source_face(source_paths : List[str]) -> Optional[Face]:
+	source_frames = read_static_images(filter_image_paths(source_paths))
+	source_faces = []
+
+	for source_frame in source_frames:
+		temp_faces = get_many_faces([ source_frame ])
+		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
+		if temp_faces:
+			source_faces.append(get_first(temp_faces))
+	return get_average_face(source_faces)
+
+
+def get_source_audio_frame(source_audio_path : str, temp_video_fps : Fps, frame_number : int) -> AudioFrame:
+	source_audio_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
+
+	if numpy.any(source_audio_frame):
+		return source_audio_frame
+	return create_empty_audio_frame()
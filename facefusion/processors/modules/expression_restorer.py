@@ -23,8 +23,8 @@ from facefusion.processors.typing import ExpressionRestorerInputs
 from facefusion.processors.typing import LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import get_video_frame, read_image, read_static_image, write_image
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.vision import clear_video_frame_buffers, clear_video_pool, get_buffered_video_frame, read_image, read_static_image, write_image
 
 
 @lru_cache(maxsize = None)
@@ -102,6 +102,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('expression_restorer_factor', args.get('expression_restorer_factor'))
 
 
+def get_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
 def pre_check() -> bool:
 	model_hashes = get_model_options().get('hashes')
 	model_sources = get_model_options().get('sources')
@@ -127,6 +131,8 @@ def pre_process(mode : ProcessMode) -> bool:
 
 def post_process() -> None:
 	read_static_image.cache_clear()
+	clear_video_pool()
+	clear_video_frame_buffers()
 	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
 		clear_inference_pool()
 	if state_manager.get_item('video_memory_strategy') == 'strict':
@@ -260,13 +266,15 @@ def process_frame(inputs : ExpressionRestorerInputs) -> VisionFrame:
 
 def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	buffer_size = len(queue_payloads)
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		frame_number = queue_payload.get('frame_number')
 		if state_manager.get_item('trim_frame_start'):
 			frame_number += state_manager.get_item('trim_frame_start')
-		source_vision_frame = get_video_frame(state_manager.get_item('target_path'), frame_number)
+		source_vision_frame = get_buffered_video_frame(state_manager.get_item('target_path'), frame_number, buffer_size)
 		target_vision_path = queue_payload.get('frame_path')
+		output_vision_path = queue_payload.get('output_frame_path')
 		target_vision_frame = read_image(target_vision_path)
 		output_vision_frame = process_frame(
 		{
@@ -274,7 +282,7 @@ def process_frames(source_path : List[str], queue_payloads : List[QueuePayload],
 			'source_vision_frame': source_vision_frame,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_image(output_vision_path, output_vision_frame)
 		update_progress(1)
 
 
@@ -293,3 +301,5 @@ def process_image(source_path : str, target_path : str, output_path : str) -> No
 
 def process_video(source_paths : List[str], temp_frame_paths : List[str]) -> None:
 	processors.multi_process_frames(None, temp_frame_paths, process_frames)
+	clear_video_pool()
+	clear_video_frame_buffers()
@@ -17,7 +17,7 @@ from facefusion.filesystem import in_directory, same_file_extension
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FaceDebuggerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.typing import ApplyStateItem, Args, Face, InferencePool, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.typing import ApplyStateItem, Args, Face, FaceAttribute, InferencePool, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, write_image
 
 
@@ -40,6 +40,12 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_debugger_items', args.get('face_debugger_items'))
 
 
+def get_face_attributes() -> List[FaceAttribute]:
+	if any(face_debugger_item in state_manager.get_item('face_debugger_items') for face_debugger_item in [ 'age', 'gender', 'race' ]):
+		return [ 'classification' ]
+	return []
+
+
 def pre_check() -> bool:
 	return True
 
@@ -197,13 +203,14 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
+		output_vision_path = queue_payload['output_frame_path']
 		target_vision_frame = read_image(target_vision_path)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_image(output_vision_path, output_vision_frame)
 		update_progress(1)
 
 
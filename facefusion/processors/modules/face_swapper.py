@@ -24,7 +24,7 @@ from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel
 from facefusion.processors.typing import FaceSwapperInputs
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Embedding, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, read_static_images, unpack_resolution, write_image
 
 
@@ -367,6 +367,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_swapper_pixel_boost', args.get('face_swapper_pixel_boost'))
 
 
+def get_face_attributes() -> List[FaceAttribute]:
+	return [ 'embedding' ]
+
+
 def pre_check() -> bool:
 	model_hashes = get_model_options().get('hashes')
 	model_sources = get_model_options().get('sources')
@@ -428,9 +432,8 @@ def swap_face(source_face : Face, target_face : Face, temp_vision_frame : Vision
 		crop_masks.append(occlusion_mask)
 
 	pixel_boost_vision_frames = implode_pixel_boost(crop_vision_frame, pixel_boost_total, model_size)
-	for pixel_boost_vision_frame in pixel_boost_vision_frames:
-		pixel_boost_vision_frame = prepare_crop_frame(pixel_boost_vision_frame)
-		pixel_boost_vision_frame = forward_swap_face(source_face, pixel_boost_vision_frame)
+	pixel_boost_vision_frames = numpy.concatenate([ prepare_crop_frame(pixel_boost_vision_frame) for pixel_boost_vision_frame in pixel_boost_vision_frames ])
+	for pixel_boost_vision_frame in forward_swap_faces(source_face, pixel_boost_vision_frames):
 		pixel_boost_vision_frame = normalize_crop_frame(pixel_boost_vision_frame)
 		temp_vision_frames.append(pixel_boost_vision_frame)
 	crop_vision_frame = explode_pixel_boost(temp_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
@@ -444,9 +447,16 @@ def swap_face(source_face : Face, target_face : Face, temp_vision_frame : Vision
 	return temp_vision_frame
 
 
+def forward_swap_faces(source_face : Face, crop_vision_frames : VisionFrame) -> VisionFrame:
+	if inference_manager.has_dynamic_batch(get_inference_pool(), 'face_swapper'):
+		return forward_swap_face(source_face, crop_vision_frames)
+	return numpy.concatenate([ forward_swap_face(source_face, crop_vision_frame[numpy.newaxis]) for crop_vision_frame in crop_vision_frames ])
+
+
 def forward_swap_face(source_face : Face, crop_vision_frame : VisionFrame) -> VisionFrame:
 	face_swapper = get_inference_pool().get('face_swapper')
 	model_type = get_model_options().get('type')
+	crop_vision_total = crop_vision_frame.shape[0]
 	face_swapper_inputs = {}
 
 	if has_execution_provider('coreml') and model_type in [ 'ghost', 'uniface' ]:
@@ -455,14 +465,14 @@ def forward_swap_face(source_face : Face, crop_vision_frame : VisionFrame) -> Vi
 	for face_swapper_input in face_swapper.get_inputs():
 		if face_swapper_input.name == 'source':
 			if model_type in [ 'blendswap', 'uniface' ]:
-				face_swapper_inputs[face_swapper_input.name] = prepare_source_frame(source_face)
+				face_swapper_inputs[face_swapper_input.name] = numpy.repeat(prepare_source_frame(source_face), crop_vision_total, axis = 0)
 			else:
-				face_swapper_inputs[face_swapper_input.name] = prepare_source_embedding(source_face)
+				face_swapper_inputs[face_swapper_input.name] = numpy.repeat(prepare_source_embedding(source_face), crop_vision_total, axis = 0)
 		if face_swapper_input.name == 'target':
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0]
 
 	return crop_vision_frame
 
@@ -582,6 +592,7 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
+		output_vision_path = queue_payload['output_frame_path']
 		target_vision_frame = read_image(target_vision_path)
 		output_vision_frame = process_frame(
 		{
@@ -589,7 +600,7 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 			'source_face': source_face,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_image(output_vision_path, output_vision_frame)
 		update_progress(1)
 
 
@@ -17,7 +17,7 @@ from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FrameEnhancerInputs
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import create_tile_frames, merge_tile_frames, read_image, read_static_image, write_image
 
 
@@ -412,12 +412,18 @@ def register_args(program : ArgumentParser) -> None:
 	if group_processors:
 		group_processors.add_argument('--frame-enhancer-model', help = wording.get('help.frame_enhancer_model'), default = config.get_str_value('processors.frame_enhancer_model', 'span_kendata_x4'), choices = processors_choices.frame_enhancer_models)
 		group_processors.add_argument('--frame-enhancer-blend', help = wording.get('help.frame_enhancer_blend'), type = int, default = config.get_int_value('processors.frame_enhancer_blend', '80'), choices = processors_choices.frame_enhancer_blend_range, metavar = create_int_metavar(processors_choices.frame_enhancer_blend_range))
-		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend' ])
+		group_processors.add_argument('--frame-enhancer-batch-size', help = wording.get('help.frame_enhancer_batch_size'), type = int, default = config.get_int_value('processors.frame_enhancer_batch_size', '4'), choices = processors_choices.frame_enhancer_batch_size_range, metavar = create_int_metavar(processors_choices.frame_enhancer_batch_size_range))
+		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend', 'frame_enhancer_batch_size' ])
 
 
 def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('frame_enhancer_model', args.get('frame_enhancer_model'))
 	apply_state_item('frame_enhancer_blend', args.get('frame_enhancer_blend'))
+	apply_state_item('frame_enhancer_batch_size', args.get('frame_enhancer_batch_size'))
+
+
+def get_face_attributes() -> List[FaceAttribute]:
+	return []
 
 
 def pre_check() -> bool:
@@ -453,11 +459,13 @@ def enhance_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 	model_scale = get_model_options().get('scale')
 	temp_height, temp_width = temp_vision_frame.shape[:2]
 	tile_vision_frames, pad_width, pad_height = create_tile_frames(temp_vision_frame, model_size)
+	tile_batch_size = get_tile_batch_size()
 
-	for index, tile_vision_frame in enumerate(tile_vision_frames):
-		tile_vision_frame = prepare_tile_frame(tile_vision_frame)
-		tile_vision_frame = forward(tile_vision_frame)
-		tile_vision_frames[index] = normalize_tile_frame(tile_vision_frame)
+	for index in range(0, len(tile_vision_frames), tile_batch_size):
+		batch_vision_frames = numpy.concatenate([ prepare_tile_frame(tile_vision_frame) for tile_vision_frame in tile_vision_frames[index:index + tile_batch_size] ])
+		batch_vision_frames = forward(batch_vision_frames)
+		for batch_index, batch_vision_frame in enumerate(batch_vision_frames):
+			tile_vision_frames[index + batch_index] = normalize_tile_frame(batch_vision_frame[numpy.newaxis])
 
 	merge_vision_frame = merge_tile_frames(tile_vision_frames, temp_width * model_scale, temp_height * model_scale, pad_width * model_scale, pad_height * model_scale, (model_size[0] * model_scale, model_size[1] * model_scale, model_size[2] * model_scale))
 	temp_vision_frame = blend_frame(temp_vision_frame, merge_vision_frame)
@@ -476,6 +484,12 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	return tile_vision_frame
 
 
+def get_tile_batch_size() -> int:
+	if inference_manager.has_dynamic_batch(get_inference_pool(), 'frame_enhancer'):
+		return state_manager.get_item('frame_enhancer_batch_size') or 1
+	return 1
+
+
 def prepare_tile_frame(vision_tile_frame : VisionFrame) -> VisionFrame:
 	vision_tile_frame = numpy.expand_dims(vision_tile_frame[:, :, ::-1], axis = 0)
 	vision_tile_frame = vision_tile_frame.transpose(0, 3, 1, 2)
@@ -508,12 +522,13 @@ def process_frame(inputs : FrameEnhancerInputs) -> VisionFrame:
 def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
+		output_vision_path = queue_payload['output_frame_path']
 		target_vision_frame = read_image(target_vision_path)
 		output_vision_frame = process_frame(
 		{
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_image(output_vision_path, output_vision_frame)
 		update_progress(1)
 
 
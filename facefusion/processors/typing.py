@@ -103,6 +103,7 @@ ProcessorStateKey = Literal\
 	'frame_colorizer_blend',
 	'frame_enhancer_model',
 	'frame_enhancer_blend',
+	'frame_enhancer_batch_size',
 	'lip_syncer_model'
 ]
 ProcessorState = TypedDict('ProcessorState',
@@ -139,6 +140,7 @@ ProcessorState = TypedDict('ProcessorState',
 	'frame_colorizer_blend' : int,
 	'frame_enhancer_model' : FrameEnhancerModel,
 	'frame_enhancer_blend' : int,
+	'frame_enhancer_batch_size' : int,
 	'lip_syncer_model' : LipSyncerModel
 })
 ProcessorStateSet = Dict[AppContext, ProcessorState]
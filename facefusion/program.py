@@ -31,7 +31,8 @@ def create_temp_path_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_paths = program.add_argument_group('paths')
 	group_paths.add_argument('--temp-path', help = wording.get('help.temp_path'), default = config.get_str_value('paths.temp_path', tempfile.gettempdir()))
-	job_store.register_job_keys([ 'temp_path' ])
+	group_paths.add_argument('--face-cache-path', help = wording.get('help.face_cache_path'), default = config.get_str_value('paths.face_cache_path'))
+	job_store.register_job_keys([ 'temp_path', 'face_cache_path' ])
 	return program
 
 
@@ -100,7 +101,8 @@ def create_face_detector_program() -> ArgumentParser:
 	group_face_detector.add_argument('--face-detector-size', help = wording.get('help.face_detector_size'), default = config.get_str_value('face_detector.face_detector_size', get_last(face_detector_size_choices)), choices = face_detector_size_choices)
 	group_face_detector.add_argument('--face-detector-angles', help = wording.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector.face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
 	group_face_detector.add_argument('--face-detector-score', help = wording.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector.face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score' ])
+	group_face_detector.add_argument('--face-tracker-interval', help = wording.get('help.face_tracker_interval'), type = int, default = config.get_int_value('face_detector.face_tracker_interval', '1'), choices = facefusion.choices.face_tracker_interval_range, metavar = create_int_metavar(facefusion.choices.face_tracker_interval_range))
+	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score', 'face_tracker_interval' ])
 	return program
 
 
@@ -148,8 +150,12 @@ def create_frame_extraction_program() -> ArgumentParser:
 	group_frame_extraction.add_argument('--trim-frame-start', help = wording.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction.trim_frame_start'))
 	group_frame_extraction.add_argument('--trim-frame-end',	help = wording.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction.trim_frame_end'))
 	group_frame_extraction.add_argument('--temp-frame-format', help = wording.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction.temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+	group_frame_extraction.add_argument('--video-pipeline', help = wording.get('help.video_pipeline'), default = config.get_str_value('frame_extraction.video_pipeline', 'temp-frames'), choices = facefusion.choices.video_pipelines)
+	group_frame_extraction.add_argument('--content-analyser-mode', help = wording.get('help.content_analyser_mode'), default = config.get_str_value('frame_extraction.content_analyser_mode', 'upfront'), choices = facefusion.choices.content_analyser_modes)
+	group_frame_extraction.add_argument('--content-analyser-stride', help = wording.get('help.content_analyser_stride'), type = int, default = config.get_int_value('frame_extraction.content_analyser_stride'), choices = facefusion.choices.content_analyser_stride_range, metavar = create_int_metavar(facefusion.choices.content_analyser_stride_range))
+	group_frame_extraction.add_argument('--content-analyser-batch-size', help = wording.get('help.content_analyser_batch_size'), type = int, default = config.get_int_value('frame_extraction.content_analyser_batch_size', '8'), choices = facefusion.choices.content_analyser_batch_size_range, metavar = create_int_metavar(facefusion.choices.content_analyser_batch_size_range))
 	group_frame_extraction.add_argument('--keep-temp', help = wording.get('help.keep_temp'), action = 'store_true',	default = config.get_bool_value('frame_extraction.keep_temp'))
-	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'video_pipeline', 'content_analyser_mode', 'content_analyser_stride', 'content_analyser_batch_size', 'keep_temp' ])
 	return program
 
 
@@ -174,7 +180,8 @@ def create_processors_program() -> ArgumentParser:
 	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
 	group_processors = program.add_argument_group('processors')
 	group_processors.add_argument('--processors', help = wording.get('help.processors').format(choices = ', '.join(available_processors)), default = config.get_str_list('processors.processors', 'face_swapper'), nargs = '+')
-	job_store.register_step_keys([ 'processors' ])
+	group_processors.add_argument('--processor-mode', help = wording.get('help.processor_mode'), default = config.get_str_value('processors.processor_mode', 'sequential'), choices = facefusion.choices.processor_modes)
+	job_store.register_step_keys([ 'processors', 'processor_mode' ])
 	for processor_module in get_processors_modules(available_processors):
 		processor_module.register_args(program)
 	return program
@@ -198,7 +205,15 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution.execution_providers', 'cpu'), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution.execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
 	group_execution.add_argument('--execution-queue-count', help = wording.get('help.execution_queue_count'), type = int, default = config.get_int_value('execution.execution_queue_count', '1'), choices = facefusion.choices.execution_queue_count_range, metavar = create_int_metavar(facefusion.choices.execution_queue_count_range))
-	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count' ])
+	group_execution.add_argument('--execution-mode', help = wording.get('help.execution_mode'), default = config.get_str_value('execution.execution_mode', 'thread'), choices = facefusion.choices.execution_modes)
+	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count', 'execution_mode' ])
+	return program
+
+
+def create_job_worker_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_execution = program.add_argument_group('execution')
+	group_execution.add_argument('--job-worker-count', help = wording.get('help.job_worker_count'), type = int, default = config.get_int_value('execution.job_worker_count', '1'), choices = facefusion.choices.job_worker_count_range, metavar = create_int_metavar(facefusion.choices.job_worker_count_range))
 	return program
 
 
@@ -224,7 +239,8 @@ def create_memory_program() -> ArgumentParser:
 	group_memory = program.add_argument_group('memory')
 	group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory.video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
 	group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory.system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+	group_memory.add_argument('--face-store-memory-limit', help = wording.get('help.face_store_memory_limit'), type = int, default = config.get_int_value('memory.face_store_memory_limit', '1024'), choices = facefusion.choices.face_store_memory_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_memory_limit_range))
+	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit', 'face_store_memory_limit' ])
 	return program
 
 
@@ -287,9 +303,9 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('job-remove-step', help = wording.get('help.job_remove_step'), parents = [ create_job_id_program(), create_step_index_program(), create_jobs_path_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
 	# job runner
 	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_job_worker_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_job_worker_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	return ArgumentParser(parents = [ program ], formatter_class = create_help_formatter_small, add_help = True)
 
 
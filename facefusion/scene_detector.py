@@ -0,0 +1,65 @@
+import threading
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from typing import List
+
+import cv2
+import numpy
+
+from facefusion.typing import SceneDetector, VisionFrame
+
+SCENE_DETECTOR : SceneDetector =\
+{
+	'scene_cuts': [],
+	'scene_histograms': OrderedDict()
+}
+SCENE_DETECTOR_LOCK : threading.Lock = threading.Lock()
+SCENE_HISTOGRAM_LIMIT = 256
+SCENE_CUT_LIMIT = 0.5
+
+
+def register_scene_frame(frame_number : int, vision_frame : VisionFrame) -> bool:
+	scene_histogram = calc_scene_histogram(vision_frame)
+
+	with SCENE_DETECTOR_LOCK:
+		scene_histograms = SCENE_DETECTOR.get('scene_histograms')
+		scene_histograms[frame_number] = scene_histogram
+
+		for previous_frame_number, next_frame_number in [ (frame_number - 1, frame_number), (frame_number, frame_number + 1) ]:
+			if previous_frame_number in scene_histograms and next_frame_number in scene_histograms and next_frame_number not in SCENE_DETECTOR.get('scene_cuts'):
+				if calc_scene_delta(scene_histograms.get(previous_frame_number), scene_histograms.get(next_frame_number)) > SCENE_CUT_LIMIT:
+					insort(SCENE_DETECTOR.get('scene_cuts'), next_frame_number)
+
+		while len(scene_histograms) > SCENE_HISTOGRAM_LIMIT:
+			scene_histograms.popitem(last = False)
+		return frame_number in SCENE_DETECTOR.get('scene_cuts')
+
+
+def calc_scene_histogram(vision_frame : VisionFrame) -> numpy.ndarray:
+	scene_vision_frame = cv2.resize(vision_frame, (64, 36), interpolation = cv2.INTER_AREA)
+	scene_vision_frame = cv2.cvtColor(scene_vision_frame, cv2.COLOR_BGR2HSV)
+	scene_histogram = cv2.calcHist([ scene_vision_frame ], [ 0, 1 ], None, [ 16, 16 ], [ 0, 180, 0, 256 ])
+	return cv2.normalize(scene_histogram, scene_histogram)
+
+
+def calc_scene_delta(previous_scene_histogram : numpy.ndarray, scene_histogram : numpy.ndarray) -> float:
+	return cv2.compareHist(previous_scene_histogram, scene_histogram, cv2.HISTCMP_BHATTACHARYYA)
+
+
+def get_scene_cuts() -> List[int]:
+	return SCENE_DETECTOR.get('scene_cuts')
+
+
+def has_scene_cut(start_frame_number : int, end_frame_number : int) -> bool:
+	with SCENE_DETECTOR_LOCK:
+		if all(frame_number in SCENE_DETECTOR.get('scene_histograms') for frame_number in range(start_frame_number, end_frame_number + 1)):
+			scene_cuts = SCENE_DETECTOR.get('scene_cuts')
+			scene_cut_index = bisect_right(scene_cuts, start_frame_number)
+			return scene_cut_index < len(scene_cuts) and scene_cuts[scene_cut_index] <= end_frame_number
+		return True
+
+
+def clear_scene_detector() -> None:
+	with SCENE_DETECTOR_LOCK:
+		SCENE_DETECTOR['scene_cuts'] = []
+		SCENE_DETECTOR['scene_histograms'] = OrderedDict()
@@ -3,7 +3,7 @@ from typing import Any, Dict
 import numpy
 
 from facefusion import logger, state_manager
-from facefusion.face_store import get_face_store
+from facefusion.face_store import get_face_store, get_face_store_statistics
 from facefusion.typing import FaceSet
 
 
@@ -46,6 +46,8 @@ def create_statistics(static_faces : FaceSet) -> Dict[str, Any]:
 def conditional_log_statistics() -> None:
 	if state_manager.get_item('log_level') == 'debug':
 		statistics = create_statistics(get_face_store().get('static_faces'))
+		for name, value in get_face_store_statistics().items():
+			statistics['face_store_' + name] = value
 
 		for name, value in statistics.items():
 			logger.debug(str(name) + ': ' + str(value), __name__)
@@ -1,5 +1,5 @@
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, TypedDict
 
 import numpy
 from numpy.typing import NDArray
@@ -13,8 +13,13 @@ Detection = NDArray[Any]
 Prediction = NDArray[Any]
 
 BoundingBox = NDArray[Any]
+BoundingBoxes = NDArray[Any]
+FaceScores = NDArray[Any]
 FaceLandmark5 = NDArray[Any]
+FaceLandmarks5 = NDArray[Any]
 FaceLandmark68 = NDArray[Any]
+FaceLandmarks68 = NDArray[Any]
+FaceDetection = Tuple[BoundingBoxes, FaceScores, FaceLandmarks5]
 FaceLandmarkSet = TypedDict('FaceLandmarkSet',
 {
 	'5' : FaceLandmark5, #type:ignore[valid-type]
@@ -44,11 +49,42 @@ Face = namedtuple('Face',
 	'race'
 ])
 FaceSet = Dict[str, List[Face]]
+FaceAttribute = Literal['embedding', 'classification']
 FaceStore = TypedDict('FaceStore',
 {
 	'static_faces' : FaceSet,
 	'reference_faces' : FaceSet
 })
+FaceStoreStatistics = TypedDict('FaceStoreStatistics',
+{
+	'hits' : int,
+	'misses' : int,
+	'evictions' : int,
+	'memory_usage' : int
+})
+FrameHashFunction = Callable[[Any], Any]
+FaceTracker = TypedDict('FaceTracker',
+{
+	'anchor_faces' : Dict[int, List[Face]]
+})
+SceneDetector = TypedDict('SceneDetector',
+{
+	'scene_cuts' : List[int],
+	'scene_histograms' : Dict[int, NDArray[Any]]
+})
+FrameCheckpoint = TypedDict('FrameCheckpoint',
+{
+	'checkpoint_hash' : Optional[str],
+	'frame_total' : Optional[int],
+	'content_analysed' : bool,
+	'processors' : Dict[str, Set[int]]
+})
+FrameCheckpointContent = Dict[str, Any]
+FaceCache = TypedDict('FaceCache',
+{
+	'faces' : Dict[int, List[Face]],
+	'modified' : bool
+})
 
 VisionFrame = NDArray[Any]
 Mask = NDArray[Any]
@@ -71,16 +107,56 @@ Duration = float
 Padding = Tuple[int, int, int, int]
 Orientation = Literal['landscape', 'portrait']
 Resolution = Tuple[int, int]
+ContentAnalysis = TypedDict('ContentAnalysis',
+{
+	'frame_start' : int,
+	'frame_end' : int,
+	'frame_step' : int,
+	'batch_size' : int,
+	'vision_frames' : List[VisionFrame],
+	'counter' : int,
+	'rejected' : Optional[bool]
+})
+VideoMetadata = TypedDict('VideoMetadata',
+{
+	'frame_total' : int,
+	'fps' : Fps,
+	'resolution' : Resolution,
+	'codec' : Optional[str],
+	'pixel_format' : Optional[str],
+	'rotation' : int,
+	'audio_codec' : Optional[str],
+	'audio_sample_rate' : int,
+	'audio_channel_total' : int
+})
+VideoFrameBuffer = TypedDict('VideoFrameBuffer',
+{
+	'video_capture' : Any,
+	'frame_position' : int,
+	'vision_frames' : Dict[int, VisionFrame],
+	'lock' : Any
+})
+VideoFrameBufferSet = Dict[Tuple[str, int], VideoFrameBuffer]
+VideoPool = TypedDict('VideoPool',
+{
+	'video_capture' : Any,
+	'frame_position' : int,
+	'last_time' : float
+})
+VideoPoolSet = Dict[Tuple[str, int], VideoPool]
 
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 QueuePayload = TypedDict('QueuePayload',
 {
 	'frame_number' : int,
-	'frame_path' : str
+	'frame_path' : str,
+	'output_frame_path' : str
 })
 Args = Dict[str, Any]
 UpdateProgress = Callable[[int], None]
 ProcessFrames = Callable[[List[str], List[QueuePayload], UpdateProgress], None]
+WorkerUsage = Tuple[str, float]
+WorkerUsageSet = Dict[str, float]
 ProcessStep = Callable[[str, int, Args], bool]
 
 Content = Dict[str, Any]
@@ -107,6 +183,9 @@ FaceMaskType = Literal['box', 'occlusion', 'region']
 FaceMaskRegion = Literal['skin', 'left-eyebrow', 'right-eyebrow', 'left-eye', 'right-eye', 'glasses', 'nose', 'mouth', 'upper-lip', 'lower-lip']
 FaceMaskRegionSet = Dict[FaceMaskRegion, int]
 TempFrameFormat = Literal['bmp', 'jpg', 'png']
+VideoPipeline = Literal['temp-frames', 'stream']
+ContentAnalyserMode = Literal['upfront', 'inline']
+ProcessorMode = Literal['sequential', 'fused']
 OutputAudioEncoder = Literal['aac', 'libmp3lame', 'libopus', 'libvorbis']
 OutputVideoEncoder = Literal['libx264', 'libx265', 'libvpx-vp9', 'h264_nvenc', 'hevc_nvenc', 'h264_amf', 'hevc_amf','h264_qsv', 'hevc_qsv', 'h264_videotoolbox', 'hevc_videotoolbox']
 OutputVideoPreset = Literal['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']
@@ -118,6 +197,7 @@ ModelInitializer = NDArray[Any]
 ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'rocm', 'tensorrt']
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet = Dict[ExecutionProvider, ExecutionProviderValue]
+ExecutionMode = Literal['thread', 'process']
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -217,6 +297,7 @@ StateKey = Literal\
 	'command',
 	'config_path',
 	'temp_path',
+	'face_cache_path',
 	'jobs_path',
 	'source_paths',
 	'target_path',
@@ -228,8 +309,10 @@ StateKey = Literal\
 	'face_detector_size',
 	'face_detector_angles',
 	'face_detector_score',
+	'face_tracker_interval',
 	'face_landmarker_model',
 	'face_landmarker_score',
+	'face_attributes',
 	'face_selector_mode',
 	'face_selector_order',
 	'face_selector_gender',
@@ -248,6 +331,10 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'video_pipeline',
+	'content_analyser_mode',
+	'content_analyser_stride',
+	'content_analyser_batch_size',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_resolution',
@@ -259,6 +346,7 @@ StateKey = Literal\
 	'output_video_fps',
 	'skip_audio',
 	'processors',
+	'processor_mode',
 	'open_browser',
 	'ui_layouts',
 	'ui_workflow',
@@ -266,10 +354,13 @@ StateKey = Literal\
 	'execution_providers',
 	'execution_thread_count',
 	'execution_queue_count',
+	'execution_mode',
+	'job_worker_count',
 	'download_providers',
 	'download_scope',
 	'video_memory_strategy',
 	'system_memory_limit',
+	'face_store_memory_limit',
 	'log_level',
 	'job_id',
 	'job_status',
@@ -280,6 +371,7 @@ State = TypedDict('State',
 	'command' : str,
 	'config_path' : str,
 	'temp_path' : str,
+	'face_cache_path' : str,
 	'jobs_path' : str,
 	'source_paths' : List[str],
 	'target_path' : str,
@@ -291,8 +383,10 @@ State = TypedDict('State',
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
 	'face_detector_score' : Score,
+	'face_tracker_interval' : int,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
+	'face_attributes' : List[FaceAttribute],
 	'face_selector_mode' : FaceSelectorMode,
 	'face_selector_order' : FaceSelectorOrder,
 	'face_selector_race' : Race,
@@ -311,6 +405,10 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'video_pipeline' : VideoPipeline,
+	'content_analyser_mode' : ContentAnalyserMode,
+	'content_analyser_stride' : int,
+	'content_analyser_batch_size' : int,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_resolution' : str,
@@ -322,6 +420,7 @@ State = TypedDict('State',
 	'output_video_fps' : float,
 	'skip_audio' : bool,
 	'processors' : List[str],
+	'processor_mode' : ProcessorMode,
 	'open_browser' : bool,
 	'ui_layouts' : List[str],
 	'ui_workflow' : UiWorkflow,
@@ -329,10 +428,13 @@ State = TypedDict('State',
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
 	'execution_queue_count' : int,
+	'execution_mode' : ExecutionMode,
+	'job_worker_count' : int,
 	'download_providers' : List[DownloadProvider],
 	'download_scope' : DownloadScope,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
+	'face_store_memory_limit' : int,
 	'log_level' : LogLevel,
 	'job_id' : str,
 	'job_status' : JobStatus,
@@ -1,5 +1,14 @@
+import json
+import os
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from fractions import Fraction
 from functools import lru_cache
-from typing import List, Optional, Tuple
+from json import JSONDecodeError
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import cv2
 import numpy
@@ -8,7 +17,12 @@ from cv2.typing import Size
 import facefusion.choices
 from facefusion.common_helper import is_windows
 from facefusion.filesystem import is_image, is_video, sanitize_path_for_windows
-from facefusion.typing import Duration, Fps, Orientation, Resolution, VisionFrame
+from facefusion.typing import Duration, Fps, Orientation, Resolution, VideoFrameBuffer, VideoFrameBufferSet, VideoMetadata, VideoPool, VideoPoolSet, VisionFrame
+
+VIDEO_POOL_SET : VideoPoolSet = {}
+VIDEO_POOL_LOCK : threading.Lock = threading.Lock()
+VIDEO_POOL_IDLE_TIMEOUT = 10
+VIDEO_FRAME_BUFFER_SET : VideoFrameBufferSet = {}
 
 
 @lru_cache(maxsize = 128)
@@ -72,42 +86,214 @@ def create_image_resolutions(resolution : Resolution) -> List[str]:
 	return resolutions
 
 
+def get_video_pool(video_path : str) -> VideoPool:
+	video_pool_key = (video_path, threading.get_ident())
+
+	with VIDEO_POOL_LOCK:
+		release_idle_video_pools()
+		if video_pool_key not in VIDEO_POOL_SET:
+			if is_windows():
+				video_path = sanitize_path_for_windows(video_path)
+			VIDEO_POOL_SET[video_pool_key] =\
+			{
+				'video_capture': cv2.VideoCapture(video_path),
+				'frame_position': 0,
+				'last_time': time()
+			}
+		video_pool = VIDEO_POOL_SET.get(video_pool_key)
+		video_pool['last_time'] = time()
+	return video_pool
+
+
+def release_idle_video_pools() -> None:
+	for video_pool_key, video_pool in list(VIDEO_POOL_SET.items()):
+		if time() - video_pool.get('last_time') > VIDEO_POOL_IDLE_TIMEOUT:
+			video_pool.get('video_capture').release()
+			del VIDEO_POOL_SET[video_pool_key]
+
+
+def clear_video_pool() -> None:
+	with VIDEO_POOL_LOCK:
+		for video_pool in VIDEO_POOL_SET.values():
+			video_pool.get('video_capture').release()
+		VIDEO_POOL_SET.clear()
+
+
 def get_video_frame(video_path : str, frame_number : int = 0) -> Optional[VisionFrame]:
 	if is_video(video_path):
-		if is_windows():
-			video_path = sanitize_path_for_windows(video_path)
-		video_capture = cv2.VideoCapture(video_path)
+		video_pool = get_video_pool(video_path)
+		video_capture = video_pool.get('video_capture')
 		if video_capture.isOpened():
-			frame_total = video_capture.get(cv2.CAP_PROP_FRAME_COUNT)
-			video_capture.set(cv2.CAP_PROP_POS_FRAMES, min(frame_total, frame_number - 1))
+			frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+			frame_position = max(0, min(frame_total, frame_number - 1))
+			if frame_position != video_pool.get('frame_position'):
+				video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_position)
 			has_vision_frame, vision_frame = video_capture.read()
-			video_capture.release()
+			video_pool['frame_position'] = frame_position + 1 if has_vision_frame else -1
 			if has_vision_frame:
 				return vision_frame
 	return None
 
 
-def count_video_frame_total(video_path : str) -> int:
+def detect_video_metadata(video_path : str) -> Optional[VideoMetadata]:
 	if is_video(video_path):
-		if is_windows():
-			video_path = sanitize_path_for_windows(video_path)
-		video_capture = cv2.VideoCapture(video_path)
-		if video_capture.isOpened():
-			video_frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
-			video_capture.release()
-			return video_frame_total
+		return detect_static_video_metadata(video_path, os.path.getmtime(video_path), os.path.getsize(video_path))
+	return None
+
+
+@lru_cache(maxsize = 128)
+def detect_static_video_metadata(video_path : str, video_mtime : float, video_size : int) -> Optional[VideoMetadata]:
+	video_metadata = probe_video_metadata(video_path)
+
+	if video_metadata and not video_metadata.get('frame_total'):
+		capture_metadata = capture_video_metadata(video_path)
+		if capture_metadata:
+			video_metadata['frame_total'] = capture_metadata.get('frame_total')
+	return video_metadata or capture_video_metadata(video_path)
+
+
+def probe_video_metadata(video_path : str) -> Optional[VideoMetadata]:
+	if shutil.which('ffprobe'):
+		commands = [ shutil.which('ffprobe'), '-loglevel', 'error', '-show_streams', '-show_format', '-of', 'json', video_path ]
+		process = subprocess.run(commands, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+
+		try:
+			probe_output = json.loads(process.stdout.decode())
+		except JSONDecodeError:
+			return None
+		return parse_video_metadata(probe_output)
+	return None
+
+
+def parse_video_metadata(probe_output : Dict[str, Any]) -> Optional[VideoMetadata]:
+	streams = probe_output.get('streams', [])
+	video_stream = next((stream for stream in streams if stream.get('codec_type') == 'video'), None)
+	audio_stream = next((stream for stream in streams if stream.get('codec_type') == 'audio'), {})
+
+	if video_stream:
+		video_rotation = detect_stream_rotation(video_stream)
+		video_resolution = int(video_stream.get('width')), int(video_stream.get('height'))
+		video_fps = parse_stream_fps(video_stream.get('avg_frame_rate')) or parse_stream_fps(video_stream.get('r_frame_rate'))
+		video_duration = float(video_stream.get('duration') or probe_output.get('format', {}).get('duration') or 0)
+		video_frame_total = int(video_stream.get('nb_frames', 0))
+
+		if video_rotation in [ 90, 270 ]:
+			video_resolution = video_resolution[::-1]
+		if not video_frame_total:
+			video_frame_total = round(video_duration * video_fps)
+		return\
+		{
+			'frame_total': video_frame_total,
+			'fps': video_fps,
+			'resolution': video_resolution,
+			'codec': video_stream.get('codec_name'),
+			'pixel_format': video_stream.get('pix_fmt'),
+			'rotation': video_rotation,
+			'audio_codec': audio_stream.get('codec_name'),
+			'audio_sample_rate': int(audio_stream.get('sample_rate', 0)),
+			'audio_channel_total': int(audio_stream.get('channels', 0))
+		}
+	return None
+
+
+def parse_stream_fps(stream_fps : Optional[str]) -> Fps:
+	if stream_fps and not stream_fps.endswith('/0'):
+		return float(Fraction(stream_fps))
+	return 0.0
+
+
+def detect_stream_rotation(video_stream : Dict[str, Any]) -> int:
+	for side_data in video_stream.get('side_data_list', []):
+		if 'rotation' in side_data:
+			return int(side_data.get('rotation')) % 360
+	return int(video_stream.get('tags', {}).get('rotate', 0)) % 360
+
+
+def capture_video_metadata(video_path : str) -> Optional[VideoMetadata]:
+	if is_windows():
+		video_path = sanitize_path_for_windows(video_path)
+	video_capture = cv2.VideoCapture(video_path)
+
+	if video_capture.isOpened():
+		video_metadata : VideoMetadata =\
+		{
+			'frame_total': int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT)),
+			'fps': video_capture.get(cv2.CAP_PROP_FPS),
+			'resolution': (int(video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))),
+			'codec': None,
+			'pixel_format': None,
+			'rotation': 0,
+			'audio_codec': None,
+			'audio_sample_rate': 0,
+			'audio_channel_total': 0
+		}
+		video_capture.release()
+		return video_metadata
+	return None
+
+
+def get_video_frame_buffer(video_path : str) -> VideoFrameBuffer:
+	video_frame_buffer_key = (video_path, threading.get_ident())
+
+	with VIDEO_POOL_LOCK:
+		if video_frame_buffer_key not in VIDEO_FRAME_BUFFER_SET:
+			VIDEO_FRAME_BUFFER_SET[video_frame_buffer_key] =\
+			{
+				'video_capture': cv2.VideoCapture(sanitize_path_for_windows(video_path) if is_windows() else video_path),
+				'frame_position': 0,
+				'vision_frames': OrderedDict(),
+				'lock': threading.Lock()
+			}
+		return VIDEO_FRAME_BUFFER_SET.get(video_frame_buffer_key)
+
+
+def clear_video_frame_buffers() -> None:
+	with VIDEO_POOL_LOCK:
+		for video_frame_buffer in VIDEO_FRAME_BUFFER_SET.values():
+			video_frame_buffer.get('video_capture').release()
+		VIDEO_FRAME_BUFFER_SET.clear()
+
+
+def get_buffered_video_frame(video_path : str, frame_number : int, buffer_size : int) -> Optional[VisionFrame]:
+	if is_video(video_path):
+		video_frame_buffer = get_video_frame_buffer(video_path)
+		video_capture = video_frame_buffer.get('video_capture')
+		vision_frames = video_frame_buffer.get('vision_frames')
+
+		with video_frame_buffer.get('lock'):
+			if video_capture.isOpened():
+				frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+				frame_position = max(0, min(frame_total, frame_number - 1))
+
+				if frame_position not in vision_frames:
+					if not video_frame_buffer.get('frame_position') <= frame_position <= video_frame_buffer.get('frame_position') + buffer_size:
+						video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_position)
+						video_frame_buffer['frame_position'] = frame_position
+					while video_frame_buffer.get('frame_position') <= frame_position:
+						has_vision_frame, vision_frame = video_capture.read()
+						if not has_vision_frame:
+							break
+						vision_frames[video_frame_buffer.get('frame_position')] = vision_frame
+						video_frame_buffer['frame_position'] += 1
+						while len(vision_frames) > buffer_size:
+							vision_frames.popitem(last = False)
+				return vision_frames.get(frame_position)
+	return None
+
+
+def count_video_frame_total(video_path : str) -> int:
+	video_metadata = detect_video_metadata(video_path)
+
+	if video_metadata:
+		return video_metadata.get('frame_total')
 	return 0
 
 
 def detect_video_fps(video_path : str) -> Optional[float]:
-	if is_video(video_path):
-		if is_windows():
-			video_path = sanitize_path_for_windows(video_path)
-		video_capture = cv2.VideoCapture(video_path)
-		if video_capture.isOpened():
-			video_fps = video_capture.get(cv2.CAP_PROP_FPS)
-			video_capture.release()
-			return video_fps
+	video_metadata = detect_video_metadata(video_path)
+
+	if video_metadata:
+		return video_metadata.get('fps')
 	return None
 
 
@@ -153,15 +339,10 @@ def restrict_trim_frame(video_path : str, trim_frame_start : Optional[int], trim
 
 
 def detect_video_resolution(video_path : str) -> Optional[Resolution]:
-	if is_video(video_path):
-		if is_windows():
-			video_path = sanitize_path_for_windows(video_path)
-		video_capture = cv2.VideoCapture(video_path)
-		if video_capture.isOpened():
-			width = video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)
-			height = video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)
-			video_capture.release()
-			return int(width), int(height)
+	video_metadata = detect_video_metadata(video_path)
+
+	if video_metadata:
+		return video_metadata.get('resolution')
 	return None
 
 
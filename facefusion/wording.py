@@ -10,10 +10,15 @@ WORDING : Dict[str, Any] =\
 	'extracting_frames': 'Extracting frames with a resolution of {resolution} and {fps} frames per second',
 	'extracting_frames_succeed': 'Extracting frames succeed',
 	'extracting_frames_failed': 'Extracting frames failed',
+	'resuming_frames': 'Resuming from checkpoint with {frame_total} frames already processed',
+	'streaming_frames': 'Streaming frames with a resolution of {resolution} and {fps} frames per second',
+	'streaming_frames_succeed': 'Streaming frames succeed',
+	'streaming_frames_failed': 'Streaming frames failed',
 	'analysing': 'Analysing',
 	'extracting': 'Extracting',
 	'streaming': 'Streaming',
 	'processing': 'Processing',
+	'worker_usage': 'Worker {worker_name} was busy {worker_usage}% of {seconds} seconds',
 	'merging': 'Merging',
 	'downloading': 'Downloading',
 	'temp_frames_not_found': 'Temporary frames not found',
@@ -76,6 +81,7 @@ WORDING : Dict[str, Any] =\
 	'processing_jobs_succeed': 'Processing of all job succeed',
 	'processing_job_failed': 'Processing of job {job_id} failed',
 	'processing_jobs_failed': 'Processing of all jobs failed',
+	'job_worker_failed': 'Worker of job {job_id} failed unexpectedly',
 	'processing_step': 'Processing step {step_current} of {step_total}',
 	'validating_hash_succeed': 'Validating hash for {hash_file_name} succeed',
 	'validating_hash_failed': 'Validating hash for {hash_file_name} failed',
@@ -99,6 +105,7 @@ WORDING : Dict[str, Any] =\
 		# paths
 		'config_path': 'choose the config file to override defaults',
 		'temp_path': 'specify the directory for the temporary resources',
+		'face_cache_path': 'specify the directory to cache the face analysis of target videos across runs when frames are streamed or processed fused',
 		'jobs_path': 'specify the directory to store jobs',
 		'source_paths': 'choose the image or audio paths',
 		'target_path': 'choose the image or video path',
@@ -112,6 +119,7 @@ WORDING : Dict[str, Any] =\
 		'face_detector_size': 'specify the frame size provided to the face detector',
 		'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
 		'face_detector_score': 'filter the detected faces base on the confidence score',
+		'face_tracker_interval': 'specify the amount of frames between two full face detections while the faces in between are tracked',
 		# face landmarker
 		'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 		'face_landmarker_score': 'filter the detected face landmarks base on the confidence score',
@@ -136,6 +144,10 @@ WORDING : Dict[str, Any] =\
 		'trim_frame_start': 'specify the starting frame of the target video',
 		'trim_frame_end': 'specify the ending frame of the target video',
 		'temp_frame_format': 'specify the temporary resources format',
+		'video_pipeline': 'choose between extracting temporary frames or streaming the frames in memory',
+		'content_analyser_mode': 'choose between analysing the content upfront or inline while extracting the frames',
+		'content_analyser_stride': 'specify the amount of frames between two analysed frames (defaults to one frame per second)',
+		'content_analyser_batch_size': 'specify the amount of frames that are analysed within one inference',
 		'keep_temp': 'keep the temporary resources after processing',
 		# output creation
 		'output_image_quality': 'specify the image quality which translates to the compression factor',
@@ -149,6 +161,7 @@ WORDING : Dict[str, Any] =\
 		'skip_audio': 'omit the audio from the target video',
 		# processors
 		'processors': 'load a single or multiple processors (choices: {choices}, ...)',
+		'processor_mode': 'choose between one pass per processor or a fused pass that applies every processor per frame',
 		'age_modifier_model': 'choose the model responsible for aging the face',
 		'age_modifier_direction': 'specify the direction in which the age should be modified',
 		'deep_swapper_model': 'choose the model responsible for swapping the face',
@@ -181,6 +194,7 @@ WORDING : Dict[str, Any] =\
 		'frame_colorizer_blend': 'blend the colorized into the previous frame',
 		'frame_enhancer_model': 'choose the model responsible for enhancing the frame',
 		'frame_enhancer_blend': 'blend the enhanced into the previous frame',
+		'frame_enhancer_batch_size': 'specify the amount of tiles that are enhanced within one inference',
 		'lip_syncer_model': 'choose the model responsible for syncing the lips',
 		# uis
 		'open_browser': 'open the browser once the program is ready',
@@ -191,12 +205,15 @@ WORDING : Dict[str, Any] =\
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
 		'execution_queue_count': 'specify the amount of frames each thread is processing',
+		'execution_mode': 'choose between processing the frames in threads or in separate processes',
+		'job_worker_count': 'specify the amount of jobs processed in parallel, each with a share of the threads and memory',
 		# download
 		'download_providers': 'download using different providers (choices: {choices}, ...)',
 		'download_scope': 'specify the download scope',
 		# memory
 		'video_memory_strategy': 'balance fast processing and low VRAM usage',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'face_store_memory_limit': 'limit the RAM in megabytes used to store the analysed faces per frame',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
 		# run
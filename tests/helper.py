@@ -1,8 +1,10 @@
 import os
 import tempfile
 
+import numpy
+
 from facefusion.filesystem import create_directory, is_directory, is_file, remove_directory
-from facefusion.typing import JobStatus
+from facefusion.typing import Face, JobStatus
 
 
 def is_test_job_file(file_path : str, job_status : JobStatus) -> bool:
@@ -42,3 +44,27 @@ def prepare_test_output_directory() -> bool:
 	remove_directory(test_outputs_directory)
 	create_directory(test_outputs_directory)
 	return is_directory(test_outputs_directory)
+
+
+def create_test_face() -> Face:
+	return Face(
+		bounding_box = numpy.array([ 0, 0, 100, 100 ]),
+		score_set =
+		{
+			'detector': 0.75,
+			'landmarker': 0.5
+		},
+		landmark_set =
+		{
+			'5': numpy.ones((5, 2)),
+			'5/68': numpy.ones((5, 2)),
+			'68': numpy.tile([ [ 25, 25 ], [ 75, 75 ] ], (34, 1)),
+			'68/5': numpy.tile([ [ 25, 25 ], [ 75, 75 ] ], (34, 1))
+		},
+		angle = 90,
+		embedding = numpy.ones(512),
+		normed_embedding = numpy.ones(512) / 512,
+		gender = 'female',
+		age = range(20, 29),
+		race = 'white'
+	)
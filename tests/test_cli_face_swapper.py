@@ -37,3 +37,17 @@ def test_swap_face_to_video() -> None:
 
 	assert subprocess.run(commands).returncode == 0
 	assert is_test_output_file('test-swap-face-to-video.mp4') is True
+
+
+def test_swap_face_to_video_as_stream() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-as-stream.mp4'), '--trim-frame-end', '1', '--video-pipeline', 'stream' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-as-stream.mp4') is True
+
+
+def test_swap_face_to_video_as_fused() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-as-fused.mp4'), '--trim-frame-end', '1', '--processor-mode', 'fused' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-as-fused.mp4') is True
@@ -0,0 +1,42 @@
+from facefusion import state_manager
+from facefusion.content_analyser import calc_content_rate, calc_frame_step, create_content_analysis, is_content_analysed, is_content_rejected
+
+
+def test_create_content_analysis() -> None:
+	content_analysis = create_content_analysis(0, 300, 25.0)
+
+	assert content_analysis.get('frame_step') == 25
+	assert is_content_analysed(content_analysis) is False
+	assert is_content_rejected(content_analysis) is False
+	assert create_content_analysis(0, 300, 0.5).get('frame_step') == 1
+
+
+def test_calc_frame_step() -> None:
+	assert calc_frame_step(30.0) == 30
+
+	state_manager.init_item('content_analyser_stride', 5)
+
+	assert calc_frame_step(30.0) == 5
+
+	state_manager.init_item('content_analyser_stride', None)
+
+
+def test_calc_content_rate() -> None:
+	content_analysis = create_content_analysis(0, 300, 25.0)
+
+	assert calc_content_rate(content_analysis) == 0.0
+	assert calc_content_rate(content_analysis, 12) == 100.0
+
+	content_analysis['counter'] = 1
+
+	assert round(calc_content_rate(content_analysis), 2) == 8.33
+	assert calc_content_rate(create_content_analysis(0, 0, 25.0)) == 0.0
+
+
+def test_is_content_rejected() -> None:
+	content_analysis = create_content_analysis(0, 300, 25.0)
+	content_analysis['rejected'] = True
+
+	assert is_content_analysed(content_analysis) is True
+	assert is_content_rejected(content_analysis) is True
+	assert is_content_rejected(None) is False
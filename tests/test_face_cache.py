@@ -0,0 +1,78 @@
+import tempfile
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_cache import clear_face_cache, get_cached_faces, get_face_cache_path, load_face_cache, save_face_cache, set_cached_faces
+from .helper import create_test_face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('face_cache_path', tempfile.mkdtemp())
+	state_manager.init_item('video_pipeline', 'temp-frames')
+	state_manager.init_item('processor_mode', 'fused')
+	state_manager.init_item('face_detector_model', 'yoloface')
+	state_manager.init_item('face_detector_size', '640x640')
+	state_manager.init_item('face_detector_angles', [ 0 ])
+	state_manager.init_item('face_detector_score', 0.5)
+	state_manager.init_item('face_landmarker_model', '2dfan4')
+	state_manager.init_item('face_landmarker_score', 0.5)
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_face_cache()
+
+
+def test_get_face_cache_path() -> None:
+	_, target_path = tempfile.mkstemp(suffix = '.mp4')
+
+	assert get_face_cache_path(target_path).endswith('.npz')
+	assert get_face_cache_path('invalid') is None
+
+	state_manager.set_item('processor_mode', 'sequential')
+
+	assert get_face_cache_path(target_path) is None
+
+	state_manager.set_item('processor_mode', 'fused')
+
+
+def test_save_and_load_face_cache() -> None:
+	_, target_path = tempfile.mkstemp(suffix = '.mp4')
+
+	assert save_face_cache(target_path) is False
+
+	set_cached_faces(0, [ create_test_face() ])
+	set_cached_faces(1, [ create_test_face(), create_test_face() ])
+
+	assert save_face_cache(target_path) is True
+	assert load_face_cache(target_path) is True
+
+	cached_faces = get_cached_faces(1)
+
+	assert len(get_cached_faces(0)) == 1
+	assert len(cached_faces) == 2
+	assert cached_faces[0].bounding_box.tolist() == [ 0, 0, 100, 100 ]
+	assert cached_faces[0].landmark_set.get('68').shape == (68, 2)
+	assert cached_faces[0].angle == 90
+	assert cached_faces[0].age == range(20, 29)
+	assert cached_faces[0].race == 'white'
+	assert get_cached_faces(2) is None
+
+
+def test_save_and_load_face_cache_without_attributes() -> None:
+	_, target_path = tempfile.mkstemp(suffix = '.mp4')
+
+	set_cached_faces(0, [ create_test_face()._replace(embedding = None, normed_embedding = None, gender = None, age = None, race = None) ])
+
+	assert save_face_cache(target_path) is True
+	assert load_face_cache(target_path) is True
+
+	cached_face = get_cached_faces(0)[0]
+
+	assert cached_face.embedding is None
+	assert cached_face.normed_embedding is None
+	assert cached_face.gender is None
+	assert cached_face.age is None
+	assert cached_face.race is None
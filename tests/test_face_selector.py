@@ -0,0 +1,34 @@
+import numpy
+
+from facefusion.face_selector import calc_face_distance, find_similar_faces
+from .helper import create_test_face
+
+
+def test_find_similar_faces() -> None:
+	embeddings = numpy.eye(512)[:3]
+	faces = [ create_test_face()._replace(normed_embedding = embedding) for embedding in embeddings ]
+	reference_faces =\
+	{
+		'origin': [ create_test_face()._replace(normed_embedding = embeddings[2]), create_test_face()._replace(normed_embedding = embeddings[0]) ]
+	}
+
+	assert find_similar_faces(faces, reference_faces, 0.6) == [ faces[2], faces[0] ]
+	assert find_similar_faces(faces, reference_faces, 1.5) == faces + faces
+	assert find_similar_faces(faces, {}, 0.6) == []
+
+
+def test_find_similar_faces_without_embedding() -> None:
+	faces = [ create_test_face()._replace(normed_embedding = None) ]
+	reference_faces =\
+	{
+		'origin': [ create_test_face()._replace(normed_embedding = numpy.eye(512)[0]) ]
+	}
+
+	assert find_similar_faces(faces, reference_faces, 0.6) == []
+
+
+def test_calc_face_distance() -> None:
+	embeddings = numpy.eye(512)[:2]
+
+	assert calc_face_distance(create_test_face()._replace(normed_embedding = embeddings[0]), create_test_face()._replace(normed_embedding = embeddings[0])) == 0
+	assert calc_face_distance(create_test_face()._replace(normed_embedding = embeddings[0]), create_test_face()._replace(normed_embedding = embeddings[1])) == 1
@@ -0,0 +1,68 @@
+import hashlib
+from functools import partial
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_store import calc_faces_memory, clear_static_faces, create_frame_hash, get_face_store, get_face_store_statistics, get_static_faces, set_frame_hash_function, set_static_faces
+from .helper import create_test_face
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	state_manager.init_item('face_store_memory_limit', 0)
+	clear_static_faces()
+
+
+def test_get_static_faces() -> None:
+	vision_frame = numpy.ones((8, 8, 3), dtype = numpy.uint8)
+	face_store_statistics = get_face_store_statistics()
+	hits = face_store_statistics.get('hits')
+	misses = face_store_statistics.get('misses')
+
+	assert get_static_faces(vision_frame) is None
+
+	set_static_faces(vision_frame, [ create_test_face() ])
+
+	assert len(get_static_faces(vision_frame)) == 1
+	assert face_store_statistics.get('hits') == hits + 1
+	assert face_store_statistics.get('misses') == misses + 1
+
+
+def test_set_static_faces_with_empty_frame() -> None:
+	vision_frame = numpy.zeros((8, 8, 3), dtype = numpy.uint8)
+	set_static_faces(vision_frame, [ create_test_face() ])
+
+	assert get_static_faces(vision_frame) is None
+	assert len(get_face_store().get('static_faces')) == 0
+
+
+def test_evict_static_faces() -> None:
+	faces = [ create_test_face() ]
+	state_manager.init_item('face_store_memory_limit', 1)
+	face_store_statistics = get_face_store_statistics()
+	evictions = face_store_statistics.get('evictions')
+	vision_frame_total = 1024 ** 2 // calc_faces_memory(faces) + 10
+
+	for index in range(vision_frame_total):
+		set_static_faces(numpy.full((8, 8, 3), index + 1, dtype = numpy.uint16), faces)
+
+	assert face_store_statistics.get('evictions') > evictions
+	assert face_store_statistics.get('memory_usage') <= 1024 ** 2
+	assert get_static_faces(numpy.full((8, 8, 3), 1, dtype = numpy.uint16)) is None
+	assert get_static_faces(numpy.full((8, 8, 3), vision_frame_total, dtype = numpy.uint16))
+	assert len(get_face_store().get('static_faces')) < vision_frame_total
+
+
+def test_set_frame_hash_function() -> None:
+	vision_frame = numpy.ones((8, 8, 3), dtype = numpy.uint8)
+	set_static_faces(vision_frame, [ create_test_face() ])
+	set_frame_hash_function(partial(hashlib.blake2b, digest_size = 16))
+
+	assert create_frame_hash(vision_frame) == hashlib.blake2b(vision_frame, digest_size = 16).hexdigest()
+	assert get_static_faces(vision_frame) is None
+
+	set_frame_hash_function(hashlib.sha1)
+
+	assert create_frame_hash(vision_frame) == hashlib.sha1(vision_frame).hexdigest()
@@ -0,0 +1,47 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_tracker import clear_face_tracker, find_anchor_faces, move_bounding_box, set_anchor_faces
+from facefusion.scene_detector import clear_scene_detector, register_scene_frame
+from .helper import create_test_face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('face_tracker_interval', 5)
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_face_tracker()
+	clear_scene_detector()
+
+
+def test_find_anchor_faces() -> None:
+	anchor_faces = [ create_test_face() ]
+	set_anchor_faces(10, anchor_faces)
+
+	for frame_number in range(8, 16):
+		register_scene_frame(frame_number, numpy.zeros((360, 640, 3), dtype = numpy.uint8))
+
+	assert find_anchor_faces(10) is None
+	assert find_anchor_faces(11) == anchor_faces
+	assert find_anchor_faces(14) == anchor_faces
+	assert find_anchor_faces(15) is None
+	assert find_anchor_faces(9) is None
+
+
+def test_move_bounding_box() -> None:
+	anchor_face = create_test_face()
+
+	assert move_bounding_box(anchor_face, numpy.array([ [ 35, 45 ], [ 85, 95 ] ])).tolist() == [ 10, 20, 110, 120 ]
+	assert move_bounding_box(anchor_face, numpy.array([ [ 0, 0 ], [ 100, 100 ] ])).tolist() == [ -50, -50, 150, 150 ]
+
+
+def test_find_anchor_faces_without_scene_frames() -> None:
+	anchor_faces = [ create_test_face() ]
+	set_anchor_faces(10, anchor_faces)
+	register_scene_frame(10, numpy.zeros((360, 640, 3), dtype = numpy.uint8))
+
+	assert find_anchor_faces(11) is None
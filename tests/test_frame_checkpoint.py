@@ -0,0 +1,117 @@
+import os
+import tempfile
+from typing import List
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.frame_checkpoint import create_frame_checkpoint, filter_queue_payloads, get_frame_staging_path, has_analysed_content, process_checkpoint_frames, read_frame_checkpoint, resume_frame_checkpoint, set_analysed_content, set_frame_total, set_processed_frame, stage_queue_payload
+from facefusion.temp_helper import create_temp_directory, get_temp_frames_pattern
+from facefusion.typing import QueuePayload, UpdateProgress
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	_, target_path = tempfile.mkstemp(suffix = '.mp4')
+	state_manager.init_item('temp_path', tempfile.mkdtemp())
+	state_manager.init_item('temp_frame_format', 'png')
+	state_manager.init_item('target_path', target_path)
+	create_temp_directory(target_path)
+
+
+def create_queue_payloads(frame_total : int) -> List[QueuePayload]:
+	target_path = state_manager.get_item('target_path')
+	queue_payloads = []
+
+	for frame_number in range(frame_total):
+		frame_path = get_temp_frames_pattern(target_path, '%08d' % frame_number)
+		open(frame_path, 'w').close()
+		queue_payloads.append(
+		{
+			'frame_number': frame_number,
+			'frame_path': frame_path,
+			'output_frame_path': frame_path
+		})
+	return queue_payloads
+
+
+def test_resume_frame_checkpoint() -> None:
+	target_path = state_manager.get_item('target_path')
+
+	assert resume_frame_checkpoint(target_path) is False
+	assert set_frame_total(target_path, 3) is False
+	assert create_frame_checkpoint(target_path) is True
+	assert resume_frame_checkpoint(target_path) is False
+
+	create_queue_payloads(3)
+	set_frame_total(target_path, 3)
+
+	assert resume_frame_checkpoint(target_path) is True
+
+	os.utime(target_path, (0, 0))
+
+	assert resume_frame_checkpoint(target_path) is False
+
+
+def test_has_analysed_content() -> None:
+	target_path = state_manager.get_item('target_path')
+
+	assert has_analysed_content(target_path) is False
+	assert set_analysed_content(target_path) is False
+	assert create_frame_checkpoint(target_path) is True
+	assert has_analysed_content(target_path) is False
+	assert set_analysed_content(target_path) is True
+	assert has_analysed_content(target_path) is True
+
+
+def test_filter_queue_payloads() -> None:
+	target_path = state_manager.get_item('target_path')
+	queue_payloads = create_queue_payloads(4)
+
+	assert filter_queue_payloads(target_path, queue_payloads, [ 'face_swapper' ]) == queue_payloads
+
+	create_frame_checkpoint(target_path)
+	set_processed_frame(target_path, [ 'face_swapper' ], 0)
+	set_processed_frame(target_path, [ 'face_swapper', 'face_enhancer' ], 1)
+
+	assert filter_queue_payloads(target_path, queue_payloads, [ 'face_swapper' ]) == queue_payloads[2:]
+	assert filter_queue_payloads(target_path, queue_payloads, [ 'face_enhancer' ]) == [ queue_payloads[0] ] + queue_payloads[2:]
+	assert filter_queue_payloads(target_path, queue_payloads, [ 'face_swapper', 'face_enhancer' ]) == [ queue_payloads[0] ] + queue_payloads[2:]
+
+
+def test_filter_queue_payloads_with_staged_frame() -> None:
+	target_path = state_manager.get_item('target_path')
+	queue_payloads = create_queue_payloads(2)
+
+	create_frame_checkpoint(target_path)
+	stage_payload = stage_queue_payload(target_path, [ 'face_swapper' ], queue_payloads[0])
+	os.makedirs(os.path.dirname(stage_payload.get('output_frame_path')))
+	with open(stage_payload.get('output_frame_path'), 'w') as frame_file:
+		frame_file.write('processed')
+	set_processed_frame(target_path, [ 'face_swapper' ], 0)
+
+	assert filter_queue_payloads(target_path, queue_payloads, [ 'face_swapper' ]) == queue_payloads[1:]
+	assert open(queue_payloads[0].get('frame_path')).read() == 'processed'
+	assert os.path.exists(stage_payload.get('output_frame_path')) is False
+
+
+def test_process_checkpoint_frames() -> None:
+	target_path = state_manager.get_item('target_path')
+	queue_payloads = create_queue_payloads(3)
+	progress_totals = []
+
+	def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+		for queue_payload in queue_payloads:
+			assert open(queue_payload.get('frame_path')).read() == ''
+			with open(queue_payload.get('output_frame_path'), 'w') as frame_file:
+				frame_file.write('processed')
+			if queue_payload.get('frame_number') < 2:
+				update_progress(1)
+
+	create_frame_checkpoint(target_path)
+	process_checkpoint_frames(process_frames, [ 'face_swapper' ], [], queue_payloads, progress_totals.append)
+
+	assert progress_totals == [ 1, 1 ]
+	assert read_frame_checkpoint(target_path).get('processors') == { 'face_swapper': { 0, 1 } }
+	assert [ open(queue_payload.get('frame_path')).read() for queue_payload in queue_payloads ] == [ 'processed', 'processed', '' ]
+	assert os.path.exists(get_frame_staging_path(target_path, [ 'face_swapper' ], queue_payloads[0].get('frame_path'))) is False
@@ -1,9 +1,11 @@
+import subprocess
+import sys
 from time import sleep
 
 import pytest
 
 from facefusion.jobs.job_helper import get_step_output_path
-from facefusion.jobs.job_manager import add_step, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, get_steps, init_jobs, insert_step, move_job_file, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
+from facefusion.jobs.job_manager import add_step, claim_job, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, get_steps, init_jobs, insert_step, move_job_file, release_job, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
 from .helper import get_test_jobs_directory
 
 
@@ -101,6 +103,20 @@ def test_find_jobs() -> None:
 	pass
 
 
+def test_claim_job() -> None:
+	claim_command = [ sys.executable, '-c', 'import sys; from facefusion.jobs import job_manager; job_manager.init_jobs(sys.argv[1]); sys.exit(0 if job_manager.claim_job(sys.argv[2]) else 1)', get_test_jobs_directory(), 'job-test-claim-job' ]
+	create_job('job-test-claim-job')
+
+	assert claim_job('job-test-claim-job') is True
+	assert claim_job('job-test-claim-job') is False
+	assert subprocess.run(claim_command).returncode == 1
+	assert release_job('job-test-claim-job') is True
+	assert release_job('job-test-claim-job') is False
+	assert subprocess.run(claim_command).returncode == 0
+	assert claim_job('job-test-claim-job') is True
+	assert release_job('job-test-claim-job') is True
+
+
 def test_find_job_ids() -> None:
 	create_job('job-test-find-job-ids-1')
 	sleep(0.5)
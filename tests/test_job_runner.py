@@ -5,7 +5,7 @@ import pytest
 from facefusion import state_manager
 from facefusion.download import conditional_download
 from facefusion.filesystem import copy_file
-from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, init_jobs, submit_job, submit_jobs
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, find_job_ids, init_jobs, submit_job, submit_jobs
 from facefusion.jobs.job_runner import collect_output_set, finalize_steps, run_job, run_jobs, run_steps
 from facefusion.typing import Args
 from .helper import get_test_example_file, get_test_examples_directory, get_test_jobs_directory, get_test_output_file, is_test_output_file, prepare_test_output_directory
@@ -104,6 +104,32 @@ def test_run_jobs() -> None:
 	assert run_jobs(process_step) is True
 
 
+def test_run_jobs_with_workers() -> None:
+	args_1 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-240p.mp4'),
+		'output_path': get_test_output_file('output-1.mp4')
+	}
+	args_2 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-240p.jpg'),
+		'output_path': get_test_output_file('output-1.jpg')
+	}
+
+	create_job('job-test-run-jobs-with-workers-1')
+	create_job('job-test-run-jobs-with-workers-2')
+	add_step('job-test-run-jobs-with-workers-1', args_1)
+	add_step('job-test-run-jobs-with-workers-2', args_2)
+	submit_jobs()
+
+	assert run_jobs(process_step, 2) is True
+	assert sorted(find_job_ids('completed')) == [ 'job-test-run-jobs-with-workers-1', 'job-test-run-jobs-with-workers-2' ]
+	assert is_test_output_file('output-1.mp4') is True
+	assert is_test_output_file('output-1.jpg') is True
+
+
 @pytest.mark.skip()
 def test_retry_job() -> None:
 	pass
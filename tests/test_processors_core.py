@@ -0,0 +1,42 @@
+from types import ModuleType
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.processors.core import calc_queue_per_future, collect_face_attributes, keeps_face_geometry
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_queue_count', 1)
+
+
+def test_calc_queue_per_future() -> None:
+	assert calc_queue_per_future(1600) == 100
+	assert calc_queue_per_future(10) == 1
+	assert calc_queue_per_future(0) == 1
+
+
+def test_keeps_face_geometry() -> None:
+	target_vision_frame = numpy.zeros((8, 8, 3), dtype = numpy.uint8)
+
+	assert keeps_face_geometry(ModuleType('facefusion.processors.modules.face_enhancer'), target_vision_frame, target_vision_frame.copy()) is True
+	assert keeps_face_geometry(ModuleType('facefusion.processors.modules.face_enhancer'), target_vision_frame, numpy.zeros((16, 16, 3), dtype = numpy.uint8)) is False
+	assert keeps_face_geometry(ModuleType('facefusion.processors.modules.frame_colorizer'), target_vision_frame, target_vision_frame.copy()) is True
+
+	for processor in [ 'age_modifier', 'deep_swapper', 'expression_restorer', 'face_editor', 'face_swapper', 'lip_syncer' ]:
+		assert keeps_face_geometry(ModuleType('facefusion.processors.modules.' + processor), target_vision_frame, target_vision_frame.copy()) is False
+
+
+def test_collect_face_attributes() -> None:
+	state_manager.init_item('face_selector_mode', 'many')
+
+	assert collect_face_attributes([ 'frame_enhancer' ]) == []
+	assert collect_face_attributes([ 'face_swapper', 'frame_enhancer' ]) == [ 'embedding' ]
+
+	state_manager.init_item('face_selector_mode', 'reference')
+	state_manager.init_item('face_selector_age_start', 0)
+
+	assert collect_face_attributes([ 'frame_enhancer' ]) == [ 'classification', 'embedding' ]
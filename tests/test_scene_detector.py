@@ -0,0 +1,49 @@
+import numpy
+import pytest
+
+from facefusion.scene_detector import clear_scene_detector, get_scene_cuts, has_scene_cut, register_scene_frame
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_scene_detector()
+
+
+def test_register_scene_frame() -> None:
+	red_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	red_vision_frame[:, :, 2] = 255
+	blue_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	blue_vision_frame[:, :, 0] = 255
+
+	assert register_scene_frame(0, red_vision_frame) is False
+	assert register_scene_frame(1, red_vision_frame) is False
+	assert register_scene_frame(2, blue_vision_frame) is True
+	assert register_scene_frame(3, blue_vision_frame) is False
+	assert get_scene_cuts() == [ 2 ]
+
+
+def test_register_scene_frame_out_of_order() -> None:
+	red_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	red_vision_frame[:, :, 2] = 255
+	blue_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	blue_vision_frame[:, :, 0] = 255
+
+	assert register_scene_frame(2, blue_vision_frame) is False
+	assert register_scene_frame(0, red_vision_frame) is False
+	assert register_scene_frame(1, red_vision_frame) is False
+	assert get_scene_cuts() == [ 2 ]
+
+
+def test_has_scene_cut() -> None:
+	red_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	red_vision_frame[:, :, 2] = 255
+	blue_vision_frame = numpy.zeros((360, 640, 3), dtype = numpy.uint8)
+	blue_vision_frame[:, :, 0] = 255
+
+	for frame_number, vision_frame in enumerate([ red_vision_frame, red_vision_frame, blue_vision_frame, blue_vision_frame ]):
+		register_scene_frame(frame_number, vision_frame)
+
+	assert has_scene_cut(0, 1) is False
+	assert has_scene_cut(1, 2) is True
+	assert has_scene_cut(2, 3) is False
+	assert has_scene_cut(3, 4) is True
@@ -1,9 +1,10 @@
 import subprocess
 
+import numpy
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.vision import calc_histogram_difference, count_trim_frame_total, count_video_frame_total, create_image_resolutions, create_video_resolutions, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, get_video_frame, match_frame_color, normalize_resolution, pack_resolution, read_image, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
+from facefusion.vision import calc_histogram_difference, clear_video_pool, count_trim_frame_total, count_video_frame_total, create_image_resolutions, create_video_resolutions, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_metadata, detect_video_resolution, get_video_frame, match_frame_color, normalize_resolution, pack_resolution, parse_video_metadata, read_image, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
 from .helper import get_test_example_file, get_test_examples_directory
 
 
@@ -54,6 +55,14 @@ def test_get_video_frame() -> None:
 	assert get_video_frame('invalid') is None
 
 
+def test_get_video_frame_from_video_pool() -> None:
+	vision_frames = [ get_video_frame(get_test_example_file('target-240p-25fps.mp4'), frame_number) for frame_number in range(1, 11) ]
+	clear_video_pool()
+
+	assert numpy.array_equal(vision_frames[9], get_video_frame(get_test_example_file('target-240p-25fps.mp4'), 10))
+	assert numpy.array_equal(vision_frames[4], get_video_frame(get_test_example_file('target-240p-25fps.mp4'), 5))
+
+
 def test_count_video_frame_total() -> None:
 	assert count_video_frame_total(get_test_example_file('target-240p-25fps.mp4')) == 270
 	assert count_video_frame_total(get_test_example_file('target-240p-30fps.mp4')) == 324
@@ -61,6 +70,58 @@ def test_count_video_frame_total() -> None:
 	assert count_video_frame_total('invalid') == 0
 
 
+def test_detect_video_metadata() -> None:
+	video_metadata = detect_video_metadata(get_test_example_file('target-240p-25fps.mp4'))
+
+	assert video_metadata.get('frame_total') == 270
+	assert video_metadata.get('fps') == 25.0
+	assert video_metadata.get('resolution') == (426, 226)
+	assert video_metadata.get('rotation') == 0
+	assert detect_video_metadata(get_test_example_file('target-240p-90deg.mp4')).get('resolution') == (226, 426)
+	assert detect_video_metadata('invalid') is None
+
+
+def test_parse_video_metadata() -> None:
+	video_stream =\
+	{
+		'codec_type': 'video',
+		'codec_name': 'h264',
+		'pix_fmt': 'yuv420p',
+		'width': 426,
+		'height': 226,
+		'avg_frame_rate': '25/1',
+		'nb_frames': '270'
+	}
+	audio_stream =\
+	{
+		'codec_type': 'audio',
+		'codec_name': 'aac',
+		'sample_rate': '44100',
+		'channels': 2
+	}
+	video_metadata = parse_video_metadata({ 'streams': [ video_stream, audio_stream ] })
+
+	assert video_metadata.get('frame_total') == 270
+	assert video_metadata.get('fps') == 25.0
+	assert video_metadata.get('resolution') == (426, 226)
+	assert video_metadata.get('codec') == 'h264'
+	assert video_metadata.get('pixel_format') == 'yuv420p'
+	assert video_metadata.get('rotation') == 0
+	assert video_metadata.get('audio_codec') == 'aac'
+	assert video_metadata.get('audio_sample_rate') == 44100
+	assert video_metadata.get('audio_channel_total') == 2
+
+	video_stream.pop('nb_frames')
+	video_stream['side_data_list'] = [ { 'rotation': -90 } ]
+
+	assert parse_video_metadata({ 'streams': [ video_stream ], 'format': { 'duration': '10.8' } }).get('frame_total') == 270
+	assert parse_video_metadata({ 'streams': [ video_stream ], 'format': { 'duration': '10.8' } }).get('rotation') == 270
+	assert parse_video_metadata({ 'streams': [ video_stream ], 'format': { 'duration': '10.8' } }).get('resolution') == (226, 426)
+	assert parse_video_metadata({ 'streams': [ video_stream ] }).get('frame_total') == 0
+	assert parse_video_metadata({ 'streams': [ audio_stream ] }) is None
+	assert parse_video_metadata({}) is None
+
+
 def test_detect_video_fps() -> None:
 	assert detect_video_fps(get_test_example_file('target-240p-25fps.mp4')) == 25.0
 	assert detect_video_fps(get_test_example_file('target-240p-30fps.mp4')) == 30.0